@@ -19,7 +19,13 @@ class ConfigManager:
         "sync_interval_minutes": 30,
         "first_run": True,
         "notifications_enabled": True,
+        "minimize_to_tray": True,  # Closing the window keeps the app in the tray
         "log_level": "INFO",
+        "log_max_lines": 500,  # Activity log lines kept in the main window
+        "last_browse_dir": "",  # Directory the folder picker opens in
+        "rclone_daemon_enabled": True,  # Reuse one `rclone rcd` for quick queries
+        "cached_remotes": [],  # [name, type] pairs from the last remote listing
+        "cached_remotes_ts": 0,  # When cached_remotes was saved (epoch seconds)
         # Selective sync settings
         "selective_sync_enabled": False,
         "sync_mode": "full",  # "full", "selective_include", "selective_exclude"
@@ -27,9 +33,13 @@ class ConfigManager:
         "excluded_folders": [],  # List of folders to exclude (when sync_mode is selective_exclude)
         # Safety features
         "confirm_large_sync": True,
-        "large_sync_threshold_mb": 1000,  # Warn if sync size exceeds this
+        "large_sync_threshold_mb": 1000,  # First sync pauses for confirmation past this
+        "max_delete": 1000,  # First sync stops rather than delete more files than this
         "bandwidth_limit_kbps": 0,  # 0 = no limit
-        "dry_run_first_sync": True,
+        # Parallelism: transfers are network bound, checkers CPU bound
+        "rclone_transfers": 16,
+        "rclone_checkers": max(8, (os.cpu_count() or 4) * 2),
+        "lock_mode": "exit",  # Another instance syncing: "exit" skips, "wait" queues
         # ProtonDrive authentication
         "protondrive_configured": False,
         "protondrive_remote_tested": False,
@@ -46,6 +56,9 @@ class ConfigManager:
         self.config_file_path = self.config_dir / self.CONFIG_FILE
         self.config: Dict[str, Any] = {}
         
+        # Bumped on every change so callers can cache derived values
+        self.version = 0
+        
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
@@ -71,6 +84,7 @@ class ConfigManager:
             self.config = self.DEFAULT_CONFIG.copy()
             self.save_config()
         
+        self.version += 1
         return self.config
     
     def save_config(self) -> bool:
@@ -107,6 +121,7 @@ class ConfigManager:
             value: Value to set
         """
         self.config[key] = value
+        self.version += 1
     
     def update(self, updates: Dict[str, Any]) -> None:
         """Update multiple configuration values.
@@ -115,6 +130,7 @@ class ConfigManager:
             updates: Dictionary of key-value pairs to update
         """
         self.config.update(updates)
+        self.version += 1
     
     def is_first_run(self) -> bool:
         """Check if this is the first run.
@@ -127,6 +143,7 @@ class ConfigManager:
     def mark_setup_complete(self) -> None:
         """Mark the first-run setup as complete."""
         self.config["first_run"] = False
+        self.version += 1
         self.save_config()
     
     def is_configured(self) -> bool:
@@ -158,6 +175,7 @@ class ConfigManager:
         if folder_path not in included:
             included.append(folder_path)
             self.config["included_folders"] = included
+            self.version += 1
     
     def remove_included_folder(self, folder_path: str) -> None:
         """Remove a folder from the included folders list.
@@ -169,6 +187,7 @@ class ConfigManager:
         if folder_path in included:
             included.remove(folder_path)
             self.config["included_folders"] = included
+            self.version += 1
     
     def add_excluded_folder(self, folder_path: str) -> None:
         """Add a folder to the excluded folders list.
@@ -180,6 +199,7 @@ class ConfigManager:
         if folder_path not in excluded:
             excluded.append(folder_path)
             self.config["excluded_folders"] = excluded
+            self.version += 1
     
     def remove_excluded_folder(self, folder_path: str) -> None:
         """Remove a folder from the excluded folders list.
@@ -191,6 +211,7 @@ class ConfigManager:
         if folder_path in excluded:
             excluded.remove(folder_path)
             self.config["excluded_folders"] = excluded
+            self.version += 1
     
     def get_sync_filters(self) -> List[str]:
         """Get rclone filter arguments based on sync settings.
@@ -240,4 +261,5 @@ class ConfigManager:
         self.config["protondrive_configured"] = True
         if tested:
             self.config["protondrive_remote_tested"] = True
+        self.version += 1
         self.save_config()
@@ -2,25 +2,94 @@
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTextEdit, QGroupBox, QLineEdit, QFileDialog,
+    QPushButton, QPlainTextEdit, QGroupBox, QLineEdit, QFileDialog,
     QComboBox, QSpinBox, QCheckBox, QDialog, QDialogButtonBox,
-    QMessageBox, QApplication, QWizard, QWizardPage, QTreeWidget,
+    QMessageBox, QWizard, QWizardPage, QTreeWidget,
     QTreeWidgetItem, QProgressBar, QRadioButton, QButtonGroup,
-    QScrollArea, QFrame
+    QScrollArea, QFrame, QCompleter, QFileSystemModel, QSystemTrayIcon
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread, QDir
 from PyQt5.QtGui import QFont, QIcon
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple, Deque
 import logging
 import subprocess
+import time
 import webbrowser
 
 from .config_manager import ConfigManager
-from .rclone_manager import RcloneManager
+from .rclone_manager import RcloneManager, SyncProgress
 from .sync_engine import SyncEngine
-from .protondrive_wizard import ModernProtonDriveAuthWizard
+from .protondrive_wizard import ModernProtonDriveAuthWizard, RemoteTestThread
+from .utils import format_bytes, format_duration
+
+# Status label text and style per sync state
+_STYLE_PAUSED = "color: orange;"
+_STYLE_SYNCING = "color: blue;"
+_STYLE_RUNNING = "color: green;"
+_STYLE_IDLE = "color: gray;"
+_STATUS_DISPLAY = {
+    "paused": ("Status: ⏸️ Paused", _STYLE_PAUSED),
+    "syncing": ("Status: 🔄 Syncing...", _STYLE_SYNCING),
+    "running": ("Status: ✅ Auto-sync enabled", _STYLE_RUNNING),
+    "idle": ("Status: ⏸️ Idle", _STYLE_IDLE),
+}
+
+_BIG_BUTTON_QSS = "QPushButton { padding: 10px; font-size: 14px; }"
+
+
+@lru_cache(maxsize=None)
+def _status_font() -> QFont:
+    """Status label font, created on first use since it needs a QApplication."""
+    return QFont("Arial", 12, QFont.Bold)
+
+
+def _set_if_changed(label: QLabel, text: str) -> None:
+    """Set label text only if it differs, avoiding a needless repaint."""
+    if label.text() != text:
+        label.setText(text)
+
+
+class RemotesProbeThread(QThread):
+    """Background thread that prefetches the configured rclone remotes."""
+    
+    remotes_ready = pyqtSignal(list)  # [(remote_name, remote_type), ...]
+    
+    def __init__(self, rclone: RcloneManager, test_remote_name: str = "", force_refresh: bool = False):
+        super().__init__()
+        self.rclone = rclone
+        self.test_remote_name = test_remote_name
+        self.force_refresh = force_refresh
+    
+    def run(self):
+        """List remotes, then pre-warm the connection test for the current one."""
+        self.remotes_ready.emit(self.rclone.list_remotes_typed(force_refresh=self.force_refresh))
+        
+        if self.test_remote_name:
+            # RcloneManager caches a success, so the wizard can skip its own test
+            self.rclone.test_remote(self.test_remote_name)
+
+
+class FolderListThread(QThread):
+    """Background thread that lists remote folders two levels deep."""
+    
+    folders_loaded = pyqtSignal(list)  # [(folder, [subfolder, ...]), ...]
+    
+    def __init__(self, rclone: RcloneManager, remote_name: str):
+        super().__init__()
+        self.rclone = rclone
+        self.remote_name = remote_name
+    
+    def run(self):
+        """List top-level folders and their direct subfolders."""
+        folders = self.rclone.list_folders(self.remote_name)
+        self.folders_loaded.emit([
+            (folder, self.rclone.list_folders(self.remote_name, folder["path"]))
+            for folder in folders
+        ])
 
 
 class ProtonDriveAuthPage(QWizardPage):
@@ -45,65 +114,73 @@ class ProtonDriveAuthPage(QWizardPage):
         # Create the remote field widget first (needed for wizard field registration)
         self.remote_field = QLineEdit()
         self.remote_field.setVisible(False)
+        self.remote_name = None
+        self.test_thread: Optional[RemoteTestThread] = None
+        self.refresh_thread: Optional[RemotesProbeThread] = None
+        
+        # Shown once a ProtonDrive remote has been found
+        self.found_label = QLabel()
+        self.found_label.setWordWrap(True)
+        self.found_label.setVisible(False)
+        layout.addWidget(self.found_label)
+        
+        # Shown while ProtonDrive still needs to be configured
+        self.setup_widget = QWidget()
+        self.setup_widget.setVisible(False)
+        setup_layout = QVBoxLayout()
+        setup_layout.setContentsMargins(0, 0, 0, 0)
+        
+        warning_label = QLabel(
+            "<p style='color: orange;'>⚠️ <b>ProtonDrive not configured yet</b></p>"
+            "<p>We'll help you set it up in just a few steps.</p>"
+        )
+        warning_label.setWordWrap(True)
+        setup_layout.addWidget(warning_label)
+        
+        # Instructions
+        instructions = QGroupBox("📖 What you'll need:")
+        inst_layout = QVBoxLayout()
+        
+        inst_text = QLabel(
+            "<ol>"
+            "<li><b>ProtonDrive account</b> (free or paid)</li>"
+            "<li><b>ProtonDrive password</b></li>"
+            "<li><b>2FA code</b> (if you have 2FA enabled)</li>"
+            "</ol>"
+            "<p><i>We'll guide you through the rclone configuration process.</i></p>"
+        )
+        inst_text.setWordWrap(True)
+        inst_layout.addWidget(inst_text)
+        instructions.setLayout(inst_layout)
+        setup_layout.addWidget(instructions)
+        
+        # Setup button
+        setup_btn = QPushButton("🔧 Configure ProtonDrive Now")
+        setup_btn.setStyleSheet("QPushButton { padding: 10px; font-size: 14px; background-color: #6d4aff; color: white; }")
+        setup_btn.clicked.connect(self.launch_rclone_config)
+        setup_layout.addWidget(setup_btn)
+        
+        # Help button
+        help_btn = QPushButton("📚 Open ProtonDrive rclone Documentation")
+        help_btn.clicked.connect(lambda: webbrowser.open("https://rclone.org/protondrive/"))
+        setup_layout.addWidget(help_btn)
+        
+        # Refresh button
+        self.refresh_btn = QPushButton("🔄 Refresh - I've configured rclone")
+        self.refresh_btn.clicked.connect(self.refresh_check)
+        setup_layout.addWidget(self.refresh_btn)
+        
+        # Collapses bursts of refresh requests into one rclone query
+        self.refresh_debounce = QTimer(self)
+        self.refresh_debounce.setSingleShot(True)
+        self.refresh_debounce.setInterval(250)
+        self.refresh_debounce.timeout.connect(self.start_refresh)
+        
+        self.setup_widget.setLayout(setup_layout)
+        layout.addWidget(self.setup_widget)
         
-        # Check if ProtonDrive is configured
-        has_pd, pd_remote = self.rclone.has_protondrive_remote()
-        
-        if has_pd:
-            # ProtonDrive already configured
-            success_label = QLabel(
-                f"<p style='color: green;'>✅ <b>Great news!</b> We found a ProtonDrive remote: <b>{pd_remote}</b></p>"
-                "<p>You can proceed to the next step.</p>"
-            )
-            success_label.setWordWrap(True)
-            layout.addWidget(success_label)
-            
-            self.remote_name = pd_remote
-            self.remote_field.setText(pd_remote)
-        else:
-            # Need to configure ProtonDrive
-            warning_label = QLabel(
-                "<p style='color: orange;'>⚠️ <b>ProtonDrive not configured yet</b></p>"
-                "<p>We'll help you set it up in just a few steps.</p>"
-            )
-            warning_label.setWordWrap(True)
-            layout.addWidget(warning_label)
-            
-            # Instructions
-            instructions = QGroupBox("📖 What you'll need:")
-            inst_layout = QVBoxLayout()
-            
-            inst_text = QLabel(
-                "<ol>"
-                "<li><b>ProtonDrive account</b> (free or paid)</li>"
-                "<li><b>ProtonDrive password</b></li>"
-                "<li><b>2FA code</b> (if you have 2FA enabled)</li>"
-                "</ol>"
-                "<p><i>We'll guide you through the rclone configuration process.</i></p>"
-            )
-            inst_text.setWordWrap(True)
-            inst_layout.addWidget(inst_text)
-            instructions.setLayout(inst_layout)
-            layout.addWidget(instructions)
-            
-            # Setup button
-            setup_btn = QPushButton("🔧 Configure ProtonDrive Now")
-            setup_btn.setStyleSheet("QPushButton { padding: 10px; font-size: 14px; background-color: #6d4aff; color: white; }")
-            setup_btn.clicked.connect(self.launch_rclone_config)
-            layout.addWidget(setup_btn)
-            
-            # Help button
-            help_btn = QPushButton("📚 Open ProtonDrive rclone Documentation")
-            help_btn.clicked.connect(lambda: webbrowser.open("https://rclone.org/protondrive/"))
-            layout.addWidget(help_btn)
-            
-            # Refresh button
-            refresh_btn = QPushButton("🔄 Refresh - I've configured rclone")
-            refresh_btn.clicked.connect(self.refresh_check)
-            layout.addWidget(refresh_btn)
-            
-            self.status_label = QLabel("")
-            layout.addWidget(self.status_label)
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
         
         # Add the hidden field widget to the layout
         layout.addWidget(self.remote_field)
@@ -112,6 +189,50 @@ class ProtonDriveAuthPage(QWizardPage):
         
         # Register field with the widget
         self.registerField("protondrive_remote*", self.remote_field)
+        
+        # Detection is deferred to initializePage so constructing the
+        # wizard never waits on rclone
+        self.probe_thread: Optional[RemotesProbeThread] = None
+        self.owner = parent.parentWidget() if parent is not None else None
+        if isinstance(self.owner, MainWindow):
+            self.owner.remotes_ready.connect(self.on_remotes_ready)
+    
+    def initializePage(self):
+        """Detect the ProtonDrive remote when the page is about to be shown."""
+        if isinstance(self.owner, MainWindow):
+            if self.owner.remotes_cache is not None:
+                self.on_remotes_ready(self.owner.remotes_cache)
+                return
+            if self.owner.remotes_probe and self.owner.remotes_probe.isRunning():
+                # The main window's prefetch will deliver the result
+                self.status_label.setText("⏳ Looking for ProtonDrive remote...")
+                return
+        
+        if self.probe_thread and self.probe_thread.isRunning():
+            return
+        
+        self.status_label.setText("⏳ Looking for ProtonDrive remote...")
+        self.probe_thread = RemotesProbeThread(self.rclone)
+        self.probe_thread.remotes_ready.connect(self.on_remotes_ready)
+        self.probe_thread.start()
+    
+    def on_remotes_ready(self, remotes: list):
+        """Handle the remote list prefetched by the main window."""
+        self.status_label.setText("")
+        self.show_detection(*self.rclone.has_protondrive_remote(remotes))
+    
+    def show_detection(self, has_pd: bool, pd_remote: Optional[str]):
+        """Show either the detected remote or the setup instructions."""
+        if has_pd:
+            self.found_label.setText(
+                f"<p style='color: green;'>✅ <b>Great news!</b> We found a ProtonDrive remote: <b>{pd_remote}</b></p>"
+                "<p>You can proceed to the next step.</p>"
+            )
+            self.remote_name = pd_remote
+            self.remote_field.setText(pd_remote)
+        
+        self.found_label.setVisible(has_pd)
+        self.setup_widget.setVisible(not has_pd)
     
     def launch_rclone_config(self):
         """Launch modern ProtonDrive configuration wizard."""
@@ -128,7 +249,23 @@ class ProtonDriveAuthPage(QWizardPage):
     
     def refresh_check(self):
         """Refresh to check if ProtonDrive is now configured."""
-        has_pd, pd_remote = self.rclone.has_protondrive_remote()
+        if self.refresh_thread and self.refresh_thread.isRunning():
+            return
+        
+        self.refresh_btn.setEnabled(False)
+        self.status_label.setText("⏳ Checking rclone configuration...")
+        self.refresh_debounce.start()
+    
+    def start_refresh(self):
+        """List remotes in the background once refresh requests settle."""
+        self.refresh_thread = RemotesProbeThread(self.rclone, force_refresh=True)
+        self.refresh_thread.remotes_ready.connect(self.on_refresh_result)
+        self.refresh_thread.start()
+    
+    def on_refresh_result(self, remotes: list):
+        """Handle the freshly listed remotes after a refresh."""
+        self.refresh_btn.setEnabled(True)
+        has_pd, pd_remote = self.rclone.has_protondrive_remote(remotes)
         
         if has_pd:
             self.status_label.setText(f"<p style='color: green;'>✅ ProtonDrive found: <b>{pd_remote}</b></p>")
@@ -148,8 +285,10 @@ class ProtonDriveAuthPage(QWizardPage):
     
     def validatePage(self):
         """Validate that ProtonDrive is configured."""
-        has_pd, pd_remote = self.rclone.has_protondrive_remote()
-        if not has_pd:
+        # Detection and refresh already run in the background and fill
+        # remote_field, so rclone is not asked again on the GUI thread
+        pd_remote = self.remote_field.text()
+        if not pd_remote:
             QMessageBox.warning(
                 self,
                 "ProtonDrive Not Configured",
@@ -158,20 +297,38 @@ class ProtonDriveAuthPage(QWizardPage):
             )
             return False
         
-        # Test the remote
         self.setField("protondrive_remote", pd_remote)
-        success, message = self.rclone.test_remote(pd_remote)
-        if not success:
+        
+        # Reuse a recent successful test, e.g. the main window's pre-warm
+        if self.rclone.is_remote_verified(pd_remote):
+            return True
+        
+        # Test the remote in the background and advance once it passes
+        if self.test_thread and self.test_thread.isRunning():
+            return False
+        
+        self.status_label.setText(f"⏳ Testing connection to '{pd_remote}'...")
+        self.wizard().button(QWizard.NextButton).setEnabled(False)
+        self.test_thread = RemoteTestThread(self.rclone, pd_remote)
+        self.test_thread.test_complete.connect(self.on_test_complete)
+        self.test_thread.start()
+        return False
+    
+    def on_test_complete(self, remote_name: str, success: bool, message: str):
+        """Handle the result of the background connection test."""
+        self.status_label.setText("")
+        self.wizard().button(QWizard.NextButton).setEnabled(True)
+        
+        if success:
+            self.wizard().next()
+        else:
             QMessageBox.warning(
                 self,
                 "Connection Test Failed",
-                f"<p>Could not connect to ProtonDrive remote '{pd_remote}'.</p>"
+                f"<p>Could not connect to ProtonDrive remote '{remote_name}'.</p>"
                 f"<p><b>Error:</b> {message}</p>"
                 "<p>Please check your configuration and try again.</p>"
             )
-            return False
-        
-        return True
 
 
 class SelectiveSyncPage(QWizardPage):
@@ -227,6 +384,8 @@ class SelectiveSyncPage(QWizardPage):
         self.status_label = QLabel("")
         layout.addWidget(self.status_label)
         
+        self.folder_thread: Optional[FolderListThread] = None
+        
         # Warning
         warning = QLabel(
             "<p style='color: #666; font-size: 11px;'>"
@@ -253,23 +412,30 @@ class SelectiveSyncPage(QWizardPage):
         remote = self.field("protondrive_remote")
         if not remote:
             return
+        if self.folder_thread and self.folder_thread.isRunning():
+            return
         
+        self.load_btn.setEnabled(False)
         self.status_label.setText("⏳ Loading folders...")
-        QApplication.processEvents()
+        self.folder_thread = FolderListThread(self.rclone, remote)
+        self.folder_thread.folders_loaded.connect(self.on_folders_loaded)
+        self.folder_thread.start()
+    
+    def on_folders_loaded(self, folder_tree: list):
+        """Populate the tree with folders listed in the background."""
+        self.load_btn.setEnabled(not self.full_radio.isChecked())
         
         try:
-            folders = self.rclone.list_folders(remote)
             self.tree_widget.clear()
             
-            for folder in folders:
+            for folder, subfolders in folder_tree:
                 item = QTreeWidgetItem([folder["name"]])
                 item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
                 item.setCheckState(0, Qt.Unchecked)
                 item.setData(0, Qt.UserRole, folder["path"])
                 self.tree_widget.addTopLevelItem(item)
                 
-                # Try to load subfolder (one level)
-                subfolders = self.rclone.list_folders(remote, folder["path"])
+                # Subfolders (one level)
                 for subfolder in subfolders:
                     subitem = QTreeWidgetItem([subfolder["name"]])
                     subitem.setFlags(subitem.flags() | Qt.ItemIsUserCheckable)
@@ -277,7 +443,7 @@ class SelectiveSyncPage(QWizardPage):
                     subitem.setData(0, Qt.UserRole, subfolder["path"])
                     item.addChild(subitem)
             
-            self.status_label.setText(f"✅ Loaded {len(folders)} folders")
+            self.status_label.setText(f"✅ Loaded {len(folder_tree)} folders")
             
         except Exception as e:
             self.status_label.setText(f"❌ Error loading folders: {str(e)}")
@@ -336,8 +502,9 @@ class SelectiveSyncPage(QWizardPage):
 class LocalFolderPage(QWizardPage):
     """Local folder selection page."""
     
-    def __init__(self, parent=None):
+    def __init__(self, config: ConfigManager, parent=None):
         super().__init__(parent)
+        self.config = config
         self.setTitle("💾 Choose Local Folder")
         self.setSubTitle("Select where to store your synced files")
         
@@ -359,6 +526,7 @@ class LocalFolderPage(QWizardPage):
         self.folder_edit = QLineEdit()
         self.folder_edit.setPlaceholderText(str(Path.home() / "ProtonDrive"))
         self.folder_edit.setText(str(Path.home() / "ProtonDrive"))
+        self.folder_edit.textEdited.connect(self.setup_completer)
         folder_layout.addWidget(self.folder_edit)
         
         browse_btn = QPushButton("📂 Browse...")
@@ -374,14 +542,27 @@ class LocalFolderPage(QWizardPage):
         self.setLayout(layout)
     
     def browse_folder(self):
-        """Browse for folder."""
+        """Browse for folder, starting from the last browsed directory."""
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Sync Folder",
-            str(Path.home())
+            self.config.get("last_browse_dir") or str(Path.home())
         )
         if folder:
             self.folder_edit.setText(folder)
+            self.config.set("last_browse_dir", folder)
+            self.config.save_config()
+    
+    def setup_completer(self):
+        """Attach a directory completer the first time the user types a path."""
+        if self.folder_edit.completer() is not None:
+            return
+        
+        # The model lists directories lazily, one level at a time
+        model = QFileSystemModel(self)
+        model.setFilter(QDir.AllDirs | QDir.NoDotAndDotDot)
+        model.setRootPath(self.config.get("last_browse_dir") or str(Path.home()))
+        self.folder_edit.setCompleter(QCompleter(model, self))
 
 
 class SyncSettingsPage(QWizardPage):
@@ -420,10 +601,6 @@ class SyncSettingsPage(QWizardPage):
         safety_group = QGroupBox("Safety Features")
         safety_layout = QVBoxLayout()
         
-        self.dry_run_check = QCheckBox("🔍 Perform dry-run before first sync (recommended)")
-        self.dry_run_check.setChecked(True)
-        safety_layout.addWidget(self.dry_run_check)
-        
         self.confirm_large_check = QCheckBox("⚠️ Warn before syncing large amounts of data")
         self.confirm_large_check.setChecked(True)
         safety_layout.addWidget(self.confirm_large_check)
@@ -459,12 +636,47 @@ class SyncSettingsPage(QWizardPage):
         bw_group.setLayout(bw_layout)
         layout.addWidget(bw_group)
         
+        # Parallelism
+        perf_group = QGroupBox("Performance")
+        perf_layout = QVBoxLayout()
+        
+        perf_info = QLabel(
+            "<p style='color: #666; font-size: 11px;'>"
+            "More parallel transfers speed up syncing many small files. "
+            "Checkers compare files and mostly use CPU."
+            "</p>"
+        )
+        perf_info.setWordWrap(True)
+        perf_layout.addWidget(perf_info)
+        
+        transfers_layout = QHBoxLayout()
+        transfers_layout.addWidget(QLabel("Parallel transfers:"))
+        self.transfers_spin = QSpinBox()
+        self.transfers_spin.setRange(1, 64)
+        self.transfers_spin.setValue(ConfigManager.DEFAULT_CONFIG["rclone_transfers"])
+        transfers_layout.addWidget(self.transfers_spin)
+        transfers_layout.addStretch()
+        perf_layout.addLayout(transfers_layout)
+        
+        checkers_layout = QHBoxLayout()
+        checkers_layout.addWidget(QLabel("Parallel checkers:"))
+        self.checkers_spin = QSpinBox()
+        self.checkers_spin.setRange(1, 128)
+        self.checkers_spin.setValue(ConfigManager.DEFAULT_CONFIG["rclone_checkers"])
+        checkers_layout.addWidget(self.checkers_spin)
+        checkers_layout.addStretch()
+        perf_layout.addLayout(checkers_layout)
+        
+        perf_group.setLayout(perf_layout)
+        layout.addWidget(perf_group)
+        
         # Register fields
         self.registerField("auto_sync", self.auto_sync_check)
         self.registerField("sync_interval", self.interval_spin)
-        self.registerField("dry_run_first", self.dry_run_check)
         self.registerField("confirm_large", self.confirm_large_check)
         self.registerField("bandwidth_limit", self.bw_spin)
+        self.registerField("rclone_transfers", self.transfers_spin)
+        self.registerField("rclone_checkers", self.checkers_spin)
         
         layout.addStretch()
         self.setLayout(layout)
@@ -505,7 +717,6 @@ class ReviewPage(QWizardPage):
         local_folder = self.field("local_folder")
         auto_sync = self.field("auto_sync")
         interval = self.field("sync_interval")
-        dry_run = self.field("dry_run_first")
         confirm_large = self.field("confirm_large")
         bandwidth = self.field("bandwidth_limit")
         
@@ -540,7 +751,6 @@ class ReviewPage(QWizardPage):
         <ul>
         <li><b>Auto sync:</b> {'Enabled' if auto_sync else 'Disabled'}</li>
         <li><b>Sync interval:</b> {interval} minutes</li>
-        <li><b>Dry-run first sync:</b> {'Yes' if dry_run else 'No'}</li>
         <li><b>Warn before large sync:</b> {'Yes' if confirm_large else 'No'}</li>
         <li><b>Bandwidth limit:</b> {bandwidth if bandwidth > 0 else 'Unlimited'} KB/s</li>
         </ul>
@@ -577,7 +787,7 @@ class EnhancedSetupWizard(QWizard):
         self.sync_page = SelectiveSyncPage(config, rclone, self)
         self.addPage(self.sync_page)
         
-        self.folder_page = LocalFolderPage(self)
+        self.folder_page = LocalFolderPage(config, self)
         self.addPage(self.folder_page)
         
         self.settings_page = SyncSettingsPage(self)
@@ -586,6 +796,44 @@ class EnhancedSetupWizard(QWizard):
         self.review_page = ReviewPage(config, self)
         self.addPage(self.review_page)
     
+    def refresh(self, config: ConfigManager):
+        """Load current configuration values into the pages and start over.
+        
+        Args:
+            config: Configuration manager to read values from
+        """
+        # Pages after the first rely on the remote even when the wizard
+        # starts past the auth page, which would otherwise detect it
+        remote = config.get("rclone_remote")
+        if remote:
+            self.auth_page.remote_name = remote
+            self.auth_page.remote_field.setText(remote)
+        
+        local_folder = config.get("local_folder")
+        if local_folder:
+            self.folder_page.folder_edit.setText(local_folder)
+        
+        sync_mode = config.get("sync_mode", "full")
+        if sync_mode == "selective_include":
+            self.sync_page.selective_radio.setChecked(True)
+        elif sync_mode == "selective_exclude":
+            self.sync_page.exclude_radio.setChecked(True)
+        else:
+            self.sync_page.full_radio.setChecked(True)
+        
+        self.settings_page.auto_sync_check.setChecked(bool(config.get("auto_sync_enabled")))
+        self.settings_page.interval_spin.setValue(config.get("sync_interval_minutes", 30))
+        self.settings_page.confirm_large_check.setChecked(config.get("confirm_large_sync", True))
+        self.settings_page.bw_spin.setValue(config.get("bandwidth_limit_kbps", 0))
+        self.settings_page.transfers_spin.setValue(
+            config.get("rclone_transfers", ConfigManager.DEFAULT_CONFIG["rclone_transfers"])
+        )
+        self.settings_page.checkers_spin.setValue(
+            config.get("rclone_checkers", ConfigManager.DEFAULT_CONFIG["rclone_checkers"])
+        )
+        
+        self.restart()
+    
     def accept(self):
         """Save configuration and complete setup."""
         # Save all settings
@@ -594,9 +842,10 @@ class EnhancedSetupWizard(QWizard):
             "local_folder": self.field("local_folder"),
             "auto_sync_enabled": self.field("auto_sync"),
             "sync_interval_minutes": self.field("sync_interval"),
-            "dry_run_first_sync": self.field("dry_run_first"),
             "confirm_large_sync": self.field("confirm_large"),
             "bandwidth_limit_kbps": self.field("bandwidth_limit"),
+            "rclone_transfers": self.field("rclone_transfers"),
+            "rclone_checkers": self.field("rclone_checkers"),
             "protondrive_configured": True,
             "protondrive_remote_tested": True,
             "setup_completed": True
@@ -612,6 +861,12 @@ class MainWindow(QMainWindow):
     
     # Signals
     show_notification = pyqtSignal(str, str)
+    quit_requested = pyqtSignal()
+    remotes_ready = pyqtSignal(list)
+    sync_started = pyqtSignal()
+    sync_completed = pyqtSignal(bool, str)
+    sync_progress = pyqtSignal(object)
+    sync_warning = pyqtSignal(str, dict)
     
     def __init__(
         self,
@@ -629,11 +884,43 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("ProtonDrive Sync")
         self.setMinimumSize(700, 600)
         
-        # Setup callbacks
-        self.sync_engine.on_sync_start = self.on_sync_start
-        self.sync_engine.on_sync_complete = self.on_sync_complete
-        self.sync_engine.on_sync_progress = self.on_sync_progress
-        self.sync_engine.on_sync_warning = self.on_sync_warning
+        # Remotes prefetched in the background for the settings wizard,
+        # seeded from the list saved by the previous run
+        saved_remotes = self.config.get("cached_remotes")
+        self.remotes_cache: Optional[List[Tuple[str, Optional[str]]]] = (
+            [tuple(remote) for remote in saved_remotes] if saved_remotes else None
+        )
+        self.remotes_probe: Optional[RemotesProbeThread] = None
+        
+        # Last rendered status, so unchanged ticks skip widget updates
+        self._last_state: Optional[str] = None
+        self._last_sync_cache: Tuple[Optional[str], Optional[str]] = (None, None)
+        
+        # Settings wizard, built on first use and reused afterwards
+        self._settings_dialog: Optional[EnhancedSetupWizard] = None
+        self._config_before_settings: Dict = {}
+        
+        # Pending activity log lines, flushed to the widget in batches
+        self._log_queue: Deque[str] = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(250)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        
+        # Log timestamp prefix, formatted at most once per second
+        self._ts_epoch = -1
+        self._ts_str = ""
+        
+        # Setup callbacks. The sync engine calls them from its worker thread,
+        # so route them through signals to run the handlers on the GUI thread.
+        self.sync_started.connect(self.on_sync_start)
+        self.sync_completed.connect(self.on_sync_complete)
+        self.sync_progress.connect(self.on_sync_progress)
+        self.sync_warning.connect(self.on_sync_warning)
+        self.sync_engine.on_sync_start = self.sync_started.emit
+        self.sync_engine.on_sync_complete = self.sync_completed.emit
+        self.sync_engine.on_sync_progress = self.sync_progress.emit
+        self.sync_engine.on_sync_warning = self.sync_warning.emit
         
         self.setup_ui()
         self.update_status()
@@ -641,7 +928,32 @@ class MainWindow(QMainWindow):
         # Start update timer
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(1000)  # Update every second
+        self.update_timer.start(5000)  # Every 5s while idle, every second while syncing
+        
+        self.prefetch_remotes()
+    
+    def prefetch_remotes(self):
+        """Enumerate rclone remotes in the background so the wizard opens instantly."""
+        if self.remotes_probe and self.remotes_probe.isRunning():
+            return
+        
+        self.remotes_probe = RemotesProbeThread(self.rclone, self.config.get("rclone_remote", ""))
+        self.remotes_probe.remotes_ready.connect(self.on_remotes_ready)
+        self.remotes_probe.start()
+    
+    def on_remotes_ready(self, remotes: list):
+        """Store prefetched remotes and forward them to any waiting wizard."""
+        changed = remotes != self.remotes_cache
+        self.remotes_cache = remotes
+        
+        # Persist so the next start can show the wizard without waiting
+        if changed:
+            self.config.update({
+                "cached_remotes": [list(remote) for remote in remotes],
+                "cached_remotes_ts": time.time()
+            })
+            self.config.save_config()
+            self.remotes_ready.emit(remotes)
     
     def setup_ui(self):
         central_widget = QWidget()
@@ -654,7 +966,7 @@ class MainWindow(QMainWindow):
         status_layout = QVBoxLayout()
         
         self.status_label = QLabel("Status: Idle")
-        self.status_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.status_label.setFont(_status_font())
         status_layout.addWidget(self.status_label)
         
         self.last_sync_label = QLabel("Last sync: Never")
@@ -708,19 +1020,19 @@ class MainWindow(QMainWindow):
         
         self.sync_btn = QPushButton("▶️ Sync Now")
         self.sync_btn.clicked.connect(self.manual_sync)
-        self.sync_btn.setStyleSheet("QPushButton { padding: 10px; font-size: 14px; }")
+        self.sync_btn.setStyleSheet(_BIG_BUTTON_QSS)
         button_layout.addWidget(self.sync_btn)
         
         self.cancel_btn = QPushButton("⏹️ Cancel")
         self.cancel_btn.clicked.connect(self.cancel_sync)
         self.cancel_btn.setEnabled(False)
-        self.cancel_btn.setStyleSheet("QPushButton { padding: 10px; font-size: 14px; }")
+        self.cancel_btn.setStyleSheet(_BIG_BUTTON_QSS)
         button_layout.addWidget(self.cancel_btn)
         
         self.pause_btn = QPushButton("⏸️ Pause")
         self.pause_btn.clicked.connect(self.pause_sync)
         self.pause_btn.setEnabled(False)
-        self.pause_btn.setStyleSheet("QPushButton { padding: 10px; font-size: 14px; }")
+        self.pause_btn.setStyleSheet(_BIG_BUTTON_QSS)
         button_layout.addWidget(self.pause_btn)
         
         layout.addLayout(button_layout)
@@ -729,8 +1041,11 @@ class MainWindow(QMainWindow):
         log_group = QGroupBox("Activity Log")
         log_layout = QVBoxLayout()
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setUndoRedoEnabled(False)
+        # Oldest lines are dropped once the cap is reached
+        self.log_text.setMaximumBlockCount(self.config.get("log_max_lines", 500))
         self.log_text.setMaximumHeight(150)
         log_layout.addWidget(self.log_text)
         
@@ -750,33 +1065,42 @@ class MainWindow(QMainWindow):
         status = self.sync_engine.get_status()
         
         if status['sync_in_progress']:
-            if status.get('sync_paused'):
-                self.status_label.setText("Status: ⏸️ Paused")
-                self.status_label.setStyleSheet("color: orange;")
-            else:
-                self.status_label.setText("Status: 🔄 Syncing...")
-                self.status_label.setStyleSheet("color: blue;")
-                self.progress_bar.setVisible(True)
+            state = "paused" if status.get('sync_paused') else "syncing"
         elif status['is_running']:
-            self.status_label.setText("Status: ✅ Auto-sync enabled")
-            self.status_label.setStyleSheet("color: green;")
-            self.progress_bar.setVisible(False)
+            state = "running"
         else:
-            self.status_label.setText("Status: ⏸️ Idle")
-            self.status_label.setStyleSheet("color: gray;")
-            self.progress_bar.setVisible(False)
+            state = "idle"
         
-        if status['last_sync_time']:
-            last_sync = datetime.fromisoformat(status['last_sync_time'])
-            time_str = last_sync.strftime("%Y-%m-%d %H:%M:%S")
+        if state != self._last_state:
+            self._last_state = state
+            
+            text, style = _STATUS_DISPLAY[state]
+            self.status_label.setText(text)
+            self.status_label.setStyleSheet(style)
+            
+            in_progress = state in ("syncing", "paused")
+            self.progress_bar.setVisible(in_progress)
+            
+            # Update button states
+            self.sync_btn.setEnabled(not in_progress)
+            self.cancel_btn.setEnabled(in_progress)
+            self.pause_btn.setEnabled(state == "syncing")
+        
+        # Show real progress once rclone knows the total size
+        progress = status.get('progress')
+        if state == "syncing" and progress is not None and progress.bytes_total:
+            if self.progress_bar.maximum() != 100:
+                self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(progress.percent)
+        
+        last_sync_iso = status['last_sync_time']
+        if last_sync_iso != self._last_sync_cache[0]:
+            if last_sync_iso:
+                time_str = datetime.fromisoformat(last_sync_iso).strftime("%Y-%m-%d %H:%M:%S")
+            else:
+                time_str = "Never"
+            self._last_sync_cache = (last_sync_iso, time_str)
             self.last_sync_label.setText(f"Last sync: {time_str}")
-        else:
-            self.last_sync_label.setText("Last sync: Never")
-        
-        # Update button states
-        self.sync_btn.setEnabled(not status['sync_in_progress'])
-        self.cancel_btn.setEnabled(status['sync_in_progress'])
-        self.pause_btn.setEnabled(status['sync_in_progress'] and not status.get('sync_paused'))
     
     def manual_sync(self):
         """Trigger manual sync."""
@@ -823,41 +1147,84 @@ class MainWindow(QMainWindow):
             self.pause_btn.clicked.disconnect()
             self.pause_btn.clicked.connect(self.pause_sync)
     
+    def get_settings_dialog(self) -> EnhancedSetupWizard:
+        """Return the settings wizard, creating it on first use."""
+        if self._settings_dialog is None:
+            self._settings_dialog = EnhancedSetupWizard(self.config, self.rclone, self)
+            self._settings_dialog.setModal(True)
+            self._settings_dialog.accepted.connect(self._on_settings_accepted)
+        return self._settings_dialog
+    
     def show_settings(self):
         """Show settings/setup dialog."""
-        wizard = EnhancedSetupWizard(self.config, self.rclone, self)
-        
-        if wizard.exec_() == QDialog.Accepted:
-            # Update UI with new config
-            self.remote_label.setText(f"Remote: {self.config.get('rclone_remote')}")
-            self.folder_label.setText(f"Local folder: {self.config.get('local_folder')}")
-            sync_mode = self.config.get("sync_mode", "full")
-            self.sync_mode_label.setText(f"Sync mode: {sync_mode.replace('_', ' ').title()}")
-            self.auto_sync_label.setText(
-                f"Auto sync: {'Enabled' if self.config.get('auto_sync_enabled') else 'Disabled'}"
-            )
-            self.log_message("Configuration updated")
-            
-            # Restart auto-sync if enabled
+        wizard = self.get_settings_dialog()
+        wizard.setStartId(0)
+        wizard.refresh(self.config)
+        self._config_before_settings = self.config.get_config_dict()
+        # open() instead of exec_() so sync signals keep flowing without a nested event loop
+        wizard.open()
+    
+    def _on_settings_accepted(self):
+        """Apply configuration changes made in the settings wizard."""
+        # Update UI with new config
+        _set_if_changed(self.remote_label, f"Remote: {self.config.get('rclone_remote')}")
+        _set_if_changed(self.folder_label, f"Local folder: {self.config.get('local_folder')}")
+        sync_mode = self.config.get("sync_mode", "full")
+        _set_if_changed(self.sync_mode_label, f"Sync mode: {sync_mode.replace('_', ' ').title()}")
+        _set_if_changed(
+            self.auto_sync_label,
+            f"Auto sync: {'Enabled' if self.config.get('auto_sync_enabled') else 'Disabled'}"
+        )
+        self.log_message("Configuration updated")
+        
+        # Pick up remotes added while the wizard was open
+        self.prefetch_remotes()
+        
+        # Restart auto-sync only if its settings changed
+        old_config = self._config_before_settings
+        if any(
+            old_config.get(key) != self.config.get(key)
+            for key in ("auto_sync_enabled", "sync_interval_minutes")
+        ):
+            self.sync_engine.stop_auto_sync()
             if self.config.get('auto_sync_enabled'):
-                self.sync_engine.stop_auto_sync()
                 self.sync_engine.start_auto_sync()
                 self.log_message("Auto-sync restarted")
+            else:
+                self.log_message("Auto-sync stopped")
     
     def manage_folders(self):
         """Manage synced folders."""
         # Open the selective sync page
-        wizard = EnhancedSetupWizard(self.config, self.rclone, self)
+        wizard = self.get_settings_dialog()
         wizard.setStartId(1)  # Start at selective sync page
-        wizard.exec_()
+        wizard.refresh(self.config)
+        self._config_before_settings = self.config.get_config_dict()
+        wizard.open()
     
     def log_message(self, message: str):
-        """Add message to activity log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        """Queue message for the activity log, flushing shortly after."""
+        sec = int(time.time())
+        if sec != self._ts_epoch:
+            self._ts_epoch = sec
+            self._ts_str = time.strftime("[%H:%M:%S] ", time.localtime(sec))
+        self._log_queue.append(self._ts_str + message)
+        
+        # Only arm the flush timer when idle so a burst lands in one write
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log(self):
+        """Write all queued log messages with a single append."""
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        if lines:
+            self.log_text.appendPlainText("\n".join(lines))
     
     def clear_log(self):
         """Clear activity log."""
+        self._log_queue.clear()
         self.log_text.clear()
     
     def on_sync_start(self):
@@ -866,6 +1233,8 @@ class MainWindow(QMainWindow):
         self.show_notification.emit("ProtonDrive Sync", "Sync started")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate
+        self.update_timer.setInterval(1000)
+        self.update_status()
     
     def on_sync_complete(self, success: bool, message: str):
         """Callback when sync completes."""
@@ -877,42 +1246,76 @@ class MainWindow(QMainWindow):
             self.show_notification.emit("ProtonDrive Sync", f"Sync failed: {message}")
         
         self.progress_bar.setVisible(False)
+        self.update_timer.setInterval(5000)
+        self.update_status()
     
-    def on_sync_progress(self, line: str):
+    def on_sync_progress(self, progress: SyncProgress):
         """Callback for sync progress updates."""
-        # Only log important progress lines to avoid spam
-        if "Transferred:" in line or "Errors:" in line or "Checks:" in line:
-            self.log_message(line)
+        line = f"Transferred: {format_bytes(progress.bytes_done)} / {format_bytes(progress.bytes_total)}"
+        if progress.bytes_total:
+            line += f", {progress.percent}%"
+        line += f", {format_bytes(progress.speed)}/s"
+        if progress.eta is not None:
+            line += f", ETA {format_duration(progress.eta)}"
+        if progress.errors:
+            line += f" ({progress.errors} errors)"
+        self.log_message(line)
     
     def on_sync_warning(self, warning_type: str, data: dict):
         """Callback for sync warnings."""
         if warning_type == "large_sync":
             size_gb = data.get("size_gb", 0)
             size_mb = data.get("size_mb", 0)
-            count = data.get("count", 0)
-            
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Warning)
-            msg.setWindowTitle("Large Sync Detected")
-            msg.setText(f"<h3>⚠️ Large sync detected</h3>")
-            msg.setInformativeText(
-                f"<p>This sync will transfer:</p>"
-                f"<ul>"
-                f"<li><b>{size_gb:.2f} GB</b> ({size_mb:.2f} MB)</li>"
-                f"<li><b>{count}</b> files</li>"
-                f"</ul>"
-                f"<p>This may take a while and use significant bandwidth.</p>"
-                f"<p>Do you want to continue?</p>"
+            title = "Large Sync Detected"
+            text = "<h3>⚠️ Large sync detected</h3>"
+            details = (
+                f"<p>The first sync paused after transferring about "
+                f"<b>{size_gb:.2f} GB</b> ({size_mb:.2f} MB), the large sync limit.</p>"
+                f"<p>Finishing it may take a while and use significant bandwidth.</p>"
             )
-            msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-            msg.setDefaultButton(QMessageBox.No)
-            
-            reply = msg.exec_()
-            if reply != QMessageBox.Yes:
-                self.sync_engine.cancel_sync()
-                self.log_message("Sync cancelled by user due to large size")
+        elif warning_type == "max_delete":
+            title = "Mass Delete Prevented"
+            text = "<h3>⚠️ Sync would delete many files</h3>"
+            details = (
+                f"<p>The first sync paused because it would delete more than "
+                f"<b>{data.get('max_delete', 0)}</b> files.</p>"
+                f"<p>Check that the local folder and remote are the ones you expect.</p>"
+            )
+        else:
+            return
+        
+        msg = QMessageBox()
+        msg.setIcon(QMessageBox.Warning)
+        msg.setWindowTitle(title)
+        msg.setText(text)
+        msg.setInformativeText(details + "<p>Do you want to continue?</p>")
+        msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        msg.setDefaultButton(QMessageBox.No)
+        
+        reply = msg.exec_()
+        if reply == QMessageBox.Yes:
+            self.log_message("Continuing sync without safety limits")
+        else:
+            self.log_message("Sync stopped by user at safety limit")
+        self.sync_engine.respond_to_warning(reply == QMessageBox.Yes)
     
     def closeEvent(self, event):
         """Handle window close event."""
-        event.ignore()
-        self.hide()
+        if self.config.get("minimize_to_tray", True) and QSystemTrayIcon.isSystemTrayAvailable():
+            # Keep running in the tray
+            event.ignore()
+            self.hide()
+        else:
+            event.accept()
+            self.quit_requested.emit()
+    
+    def hideEvent(self, event):
+        """Stop polling status while the window is hidden."""
+        super().hideEvent(event)
+        self.update_timer.stop()
+    
+    def showEvent(self, event):
+        """Resume polling status when the window is shown again."""
+        super().showEvent(event)
+        self.update_status()
+        self.update_timer.start()
@@ -36,7 +36,7 @@ class ProtonDriveSyncApp:
         
         # Initialize components
         self.config = ConfigManager()
-        self.rclone = RcloneManager(self.logger)
+        self.rclone = RcloneManager(self.logger, use_daemon=self.config.get("rclone_daemon_enabled", True))
         self.sync_engine = SyncEngine(self.config, self.rclone, self.logger)
         
         # Check rclone installation
@@ -75,6 +75,7 @@ class ProtonDriveSyncApp:
         self.tray.show_window.connect(self.show_main_window)
         self.tray.quit_app.connect(self.quit_application)
         self.main_window.show_notification.connect(self.show_notification)
+        self.main_window.quit_requested.connect(self.quit_application)
         
         # Setup status update timer
         self.status_timer = QTimer()
@@ -152,6 +153,8 @@ class ProtonDriveSyncApp:
         if self.sync_engine.is_running:
             self.sync_engine.stop_auto_sync()
         
+        self.rclone.shutdown_daemon()
+        
         # Quit Qt application
         self.app.quit()
     
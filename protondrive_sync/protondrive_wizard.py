@@ -24,8 +24,10 @@ class RcloneConfigThread(QThread):
     config_complete = pyqtSignal(bool, str)  # success, message
     
     def __init__(self, username: str, password: str, twofa_code: str, 
-                 otp_secret: str, remote_name: str, logger: Optional[logging.Logger] = None):
+                 otp_secret: str, remote_name: str, logger: Optional[logging.Logger] = None,
+                 rclone_binary: str = "rclone"):
         super().__init__()
+        self.rclone_binary = rclone_binary
         self.username = username
         self.password = password
         self.twofa_code = twofa_code
@@ -41,7 +43,7 @@ class RcloneConfigThread(QThread):
             # Create rclone config programmatically
             # We'll use rclone config create command which is non-interactive
             cmd = [
-                "rclone", "config", "create",
+                self.rclone_binary, "config", "create",
                 self.remote_name,
                 "protondrive",
                 "username", self.username,
@@ -62,6 +64,7 @@ class RcloneConfigThread(QThread):
             result = subprocess.run(
                 cmd,
                 capture_output=True,
+                stdin=subprocess.DEVNULL,
                 text=True,
                 timeout=60
             )
@@ -93,6 +96,22 @@ class RcloneConfigThread(QThread):
             self.config_complete.emit(False, f"Error: {str(e)}")
 
 
+class RemoteTestThread(QThread):
+    """Background thread that tests whether a remote is accessible."""
+    
+    test_complete = pyqtSignal(str, bool, str)  # remote_name, success, message
+    
+    def __init__(self, rclone_manager, remote_name: str):
+        super().__init__()
+        self.rclone = rclone_manager
+        self.remote_name = remote_name
+    
+    def run(self):
+        """Run the connection test."""
+        success, message = self.rclone.test_remote(self.remote_name)
+        self.test_complete.emit(self.remote_name, success, message)
+
+
 class ModernProtonDriveAuthWizard(QDialog):
     """Modern, single-page ProtonDrive authentication dialog."""
     
@@ -101,6 +120,7 @@ class ModernProtonDriveAuthWizard(QDialog):
         self.rclone = rclone_manager
         self.logger = logging.getLogger(__name__)
         self.config_thread = None
+        self.test_thread = None
         
         self.setWindowTitle("ProtonDrive Setup")
         self.setMinimumSize(600, 700)
@@ -507,10 +527,12 @@ class ModernProtonDriveAuthWizard(QDialog):
                 # Delete existing remote
                 try:
                     subprocess.run(
-                        ["rclone", "config", "delete", remote_name],
+                        [self.rclone.binary, "config", "delete", remote_name],
                         capture_output=True,
+                        stdin=subprocess.DEVNULL,
                         timeout=10
                     )
+                    self.rclone.invalidate_remotes_cache()
                 except Exception as e:
                     QMessageBox.critical(
                         self,
@@ -546,7 +568,8 @@ class ModernProtonDriveAuthWizard(QDialog):
         
         # Start configuration in background thread
         self.config_thread = RcloneConfigThread(
-            username, password, twofa_code, otp_secret, remote_name, self.logger
+            username, password, twofa_code, otp_secret, remote_name, self.logger,
+            self.rclone.binary
         )
         self.config_thread.progress_update.connect(self.on_progress_update)
         self.config_thread.config_complete.connect(self.on_configuration_complete)
@@ -572,6 +595,7 @@ class ModernProtonDriveAuthWizard(QDialog):
         self.progress_bar.setValue(1 if success else 0)
         
         if success:
+            self.rclone.invalidate_remotes_cache()
             QMessageBox.information(
                 self,
                 "Success!",
@@ -579,23 +603,12 @@ class ModernProtonDriveAuthWizard(QDialog):
                 f"<p>{message}</p>"
                 "<p>You can now proceed with setting up your sync folders.</p>"
             )
-            # Test the connection
-            remote_name = self.remote_name_input.text().strip()
-            test_success, test_message = self.rclone.test_remote(remote_name)
-            if test_success:
-                self.progress_text.append("\n✅ Connection test successful!")
-                self.accept()  # Close dialog with success
-            else:
-                self.progress_text.append(f"\n⚠️ Connection test failed: {test_message}")
-                QMessageBox.warning(
-                    self,
-                    "Connection Test Failed",
-                    f"<p>ProtonDrive was configured but the connection test failed:</p>"
-                    f"<p><b>{test_message}</b></p>"
-                    "<p>Please check your credentials and try again.</p>"
-                )
-                self.set_inputs_enabled(True)
-                self.progress_frame.setVisible(False)
+            # Test the connection in the background
+            self.progress_label.setText("Testing connection...")
+            self.progress_bar.setRange(0, 0)
+            self.test_thread = RemoteTestThread(self.rclone, self.remote_name_input.text().strip())
+            self.test_thread.test_complete.connect(self.on_connection_tested)
+            self.test_thread.start()
         else:
             QMessageBox.critical(
                 self,
@@ -606,3 +619,23 @@ class ModernProtonDriveAuthWizard(QDialog):
             )
             self.set_inputs_enabled(True)
             self.progress_frame.setVisible(False)
+    
+    def on_connection_tested(self, remote_name: str, test_success: bool, test_message: str):
+        """Handle the connection test run after configuration."""
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(1 if test_success else 0)
+        
+        if test_success:
+            self.progress_text.append("\n✅ Connection test successful!")
+            self.accept()  # Close dialog with success
+        else:
+            self.progress_text.append(f"\n⚠️ Connection test failed: {test_message}")
+            QMessageBox.warning(
+                self,
+                "Connection Test Failed",
+                f"<p>ProtonDrive was configured but the connection test failed:</p>"
+                f"<p><b>{test_message}</b></p>"
+                "<p>Please check your credentials and try again.</p>"
+            )
+            self.set_inputs_enabled(True)
+            self.progress_frame.setVisible(False)
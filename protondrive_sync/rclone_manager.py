@@ -1,24 +1,164 @@
 """Rclone integration and command execution."""
 
+import asyncio
+import atexit
+import base64
+import json
+import os
 import re
+import secrets
 import shutil
+import signal
+import socket
 import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
 from pathlib import Path
 from typing import List, Optional, Tuple, Callable, Dict
 import logging
 
 
+# Version number in the first line of `rclone version`
+_VERSION_RE = re.compile(r'v([\d.]+)')
+
+# Only JSON log records carrying transfer statistics contain this key
+_STATS_MARKER = b'"stats":'
+
+# Longest rclone output line read from the sync pipe
+_LINE_LIMIT = 1024 * 1024
+
+# rclone exit code when --max-transfer stopped the sync
+EXIT_MAX_TRANSFER = 8
+
+# Seconds a cancelled sync gets to exit before it is killed
+_KILL_GRACE = 2
+
+# Start the sync in its own process group so it can be signalled with
+# any children in one call
+if os.name == "nt":
+    _NEW_GROUP_KWARGS = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _NEW_GROUP_KWARGS = {"start_new_session": True}
+
+# API host each backend talks to, used for a quick reachability check
+_BACKEND_HOSTS = {
+    "protondrive": "mail.proton.me",
+    "drive": "www.googleapis.com",
+    "dropbox": "api.dropboxapi.com",
+    "onedrive": "graph.microsoft.com",
+    "pcloud": "api.pcloud.com",
+    "box": "api.box.com",
+    "mega": "g.api.mega.co.nz",
+}
+
+
+class SyncProgress:
+    """Transfer statistics from one rclone progress report."""
+    
+    __slots__ = ("bytes_done", "bytes_total", "speed", "eta", "transfers", "total_transfers", "errors")
+    
+    def __init__(
+        self,
+        bytes_done: int = 0,
+        bytes_total: int = 0,
+        speed: float = 0.0,
+        eta: Optional[float] = None,
+        transfers: int = 0,
+        total_transfers: int = 0,
+        errors: int = 0
+    ):
+        """Initialize the progress report.
+        
+        Args:
+            bytes_done: Bytes transferred so far
+            bytes_total: Bytes to transfer in total
+            speed: Current speed in bytes per second
+            eta: Estimated seconds remaining, or None if unknown
+            transfers: Files transferred so far
+            total_transfers: Files to transfer in total
+            errors: Errors so far
+        """
+        self.bytes_done = bytes_done
+        self.bytes_total = bytes_total
+        self.speed = speed
+        self.eta = eta
+        self.transfers = transfers
+        self.total_transfers = total_transfers
+        self.errors = errors
+    
+    @classmethod
+    def from_stats(cls, stats: Dict) -> "SyncProgress":
+        """Build a progress report from rclone's JSON stats record.
+        
+        Args:
+            stats: The "stats" object of an rclone JSON log line
+            
+        Returns:
+            SyncProgress instance
+        """
+        get = stats.get
+        return cls(
+            get("bytes") or 0,
+            get("totalBytes") or 0,
+            get("speed") or 0.0,
+            get("eta"),
+            get("transfers") or 0,
+            get("totalTransfers") or 0,
+            get("errors") or 0
+        )
+    
+    @property
+    def percent(self) -> int:
+        """Whole percentage of bytes transferred, 0 if the total is unknown."""
+        return self.bytes_done * 100 // self.bytes_total if self.bytes_total else 0
+
+
 class RcloneManager:
     """Manages rclone operations."""
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None, use_daemon: bool = True):
         """Initialize the rclone manager.
         
         Args:
             logger: Optional logger instance
+            use_daemon: Answer quick queries through a background
+                `rclone rcd` instead of running rclone for each one
         """
         self.logger = logger or logging.getLogger(__name__)
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.last_exit_code: Optional[int] = None
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Resolved once; None when rclone is not on PATH
+        self._rclone_path: Optional[str] = shutil.which("rclone")
+        
+        # Checked once so the sync output loop skips debug calls entirely
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        
+        # (timestamp, {remote name: type}) from the last successful config dump
+        self._remotes_cache: Optional[Tuple[float, Dict[str, Optional[str]]]] = None
+        self._remotes_ttl = 30.0
+        
+        # remote name -> time of the last successful connection test
+        self._tested_remotes: Dict[str, float] = {}
+        self._tested_ttl = 300.0
+        
+        # remote name -> API host from get_remote_endpoint
+        self._endpoints: Dict[str, Optional[str]] = {}
+        
+        # Memoized result of get_version()
+        self._version: Optional[str] = None
+        
+        # Background `rclone rcd`, started on first use
+        self._use_daemon = use_daemon
+        self._rcd_process: Optional[subprocess.Popen] = None
+        self._rcd_url: Optional[str] = None
+        self._rcd_auth: Optional[str] = None
+        self._rcd_lock = threading.Lock()
+        self._rcd_atexit_registered = False
     
     def is_installed(self) -> bool:
         """Check if rclone is installed.
@@ -26,25 +166,165 @@ class RcloneManager:
         Returns:
             True if rclone is installed, False otherwise
         """
-        return shutil.which("rclone") is not None
+        return self._rclone_path is not None
+    
+    @property
+    def binary(self) -> str:
+        """Path used to run rclone, falling back to a PATH lookup."""
+        return self._rclone_path or "rclone"
+    
+    def _ensure_daemon(self) -> bool:
+        """Start the rclone remote control daemon if it is not running.
+        
+        Returns:
+            True if the daemon is ready to accept requests
+        """
+        if not self._use_daemon or self._rclone_path is None:
+            return False
+        
+        with self._rcd_lock:
+            if self._rcd_process and self._rcd_process.poll() is None:
+                return True
+            
+            # Pick a free local port and credentials only this process knows
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.bind(("127.0.0.1", 0))
+                port = sock.getsockname()[1]
+            user, password = "protondrive-sync", secrets.token_urlsafe(24)
+            
+            try:
+                self._rcd_process = subprocess.Popen(
+                    [
+                        self.binary, "rcd",
+                        "--rc-addr", f"127.0.0.1:{port}"
+                    ],
+                    # Via the environment, as other users can read argv
+                    env={**os.environ, "RCLONE_RC_USER": user, "RCLONE_RC_PASS": password},
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+            except OSError as e:
+                self.logger.warning(f"Could not start rclone daemon: {e}")
+                self._use_daemon = False
+                return False
+            
+            self._rcd_url = f"http://127.0.0.1:{port}/"
+            self._rcd_auth = "Basic " + base64.b64encode(f"{user}:{password}".encode()).decode()
+            
+            # Wait for the daemon to start listening
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline and self._rcd_process.poll() is None:
+                if self._rc_request("rc/noop", {}, timeout=1) is not None:
+                    if not self._rcd_atexit_registered:
+                        atexit.register(self.shutdown_daemon)
+                        self._rcd_atexit_registered = True
+                    self.logger.info(f"rclone daemon listening on port {port}")
+                    return True
+                time.sleep(0.05)
+            
+            self.logger.warning("rclone daemon did not start, falling back to the rclone command")
+            self._stop_daemon_process()
+            self._use_daemon = False
+            return False
+    
+    def _rc_request(self, method: str, params: Dict, timeout: float) -> Optional[Dict]:
+        """Send one request to the daemon.
+        
+        Returns:
+            The decoded reply ({"error": ...} if rclone rejected the call),
+            or None if the daemon could not be reached
+        """
+        request = urllib.request.Request(
+            self._rcd_url + method,
+            data=json.dumps(params).encode(),
+            headers={"Content-Type": "application/json", "Authorization": self._rcd_auth}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            try:
+                return json.loads(e.read())
+            except ValueError:
+                return {"error": f"HTTP {e.code}"}
+        except urllib.error.URLError as e:
+            if isinstance(e.reason, socket.timeout):
+                return {"error": "Timeout"}
+            return None
+        except socket.timeout:
+            return {"error": "Timeout"}
+        except (OSError, ValueError):
+            return None
     
-    def get_version(self) -> Optional[str]:
+    def _rc(self, method: str, params: Optional[Dict] = None, timeout: float = 10) -> Optional[Dict]:
+        """Call a remote control method on the rclone daemon.
+        
+        Args:
+            method: rc method name, e.g. "config/listremotes"
+            params: Optional method parameters
+            timeout: Seconds to wait for the reply
+            
+        Returns:
+            The decoded reply, or None if the daemon is unavailable and the
+            caller should run the rclone command instead
+        """
+        if not self._ensure_daemon():
+            return None
+        return self._rc_request(method, params or {}, timeout)
+    
+    def shutdown_daemon(self) -> None:
+        """Stop the background rclone daemon if it was started."""
+        with self._rcd_lock:
+            self._stop_daemon_process()
+    
+    def _stop_daemon_process(self) -> None:
+        """Terminate the daemon process; the caller holds the lock."""
+        process, self._rcd_process = self._rcd_process, None
+        if process and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    
+    def get_version(self, force_refresh: bool = False) -> Optional[str]:
         """Get rclone version.
         
+        The version is looked up once and remembered afterwards.
+        
+        Args:
+            force_refresh: If True, query rclone again
+        
         Returns:
             Version string or None if error
         """
+        if self._version is None or force_refresh:
+            version = self._query_version()
+            if version is not None:
+                self._version = version
+            return version
+        return self._version
+    
+    def _query_version(self) -> Optional[str]:
+        """Ask rclone for its version number."""
+        reply = self._rc("core/version")
+        if reply is not None:
+            match = _VERSION_RE.search(reply.get("version", ""))
+            return match.group(1) if match else None
+        
         try:
             result = subprocess.run(
-                ["rclone", "version"],
+                [self.binary, "version"],
                 capture_output=True,
+                stdin=subprocess.DEVNULL,
                 text=True,
                 timeout=5
             )
             if result.returncode == 0:
                 # Extract version from first line
                 first_line = result.stdout.split('\n')[0]
-                match = re.search(r'v([\d.]+)', first_line)
+                match = _VERSION_RE.search(first_line)
                 if match:
                     return match.group(1)
             return None
@@ -52,59 +332,159 @@ class RcloneManager:
             self.logger.error(f"Error getting rclone version: {e}")
             return None
     
-    def list_remotes(self) -> List[str]:
+    def list_remotes(self, force_refresh: bool = False) -> List[str]:
         """List all configured rclone remotes.
         
+        Results are cached for a short time since the list rarely changes.
+        
+        Args:
+            force_refresh: If True, bypass the cache and query rclone
+        
         Returns:
             List of remote names
         """
+        return list(self._remote_types(force_refresh))
+    
+    def _remote_types(self, force_refresh: bool = False) -> Dict[str, Optional[str]]:
+        """Map each configured remote to its type using one config dump.
+        
+        Args:
+            force_refresh: If True, bypass the cache and query rclone
+        
+        Returns:
+            Dictionary of remote name to remote type (empty on error)
+        """
+        cached = None if force_refresh else self._fresh_remotes_cache()
+        if cached is not None:
+            return cached[1]
+        
+        dump = self._rc("config/dump")
+        if dump is None:
+            try:
+                result = subprocess.run(
+                    [self.binary, "config", "dump"],
+                    capture_output=True,
+                    stdin=subprocess.DEVNULL,
+                    text=True,
+                    timeout=10
+                )
+                if result.returncode != 0:
+                    self.logger.error(f"Error listing remotes: {result.stderr}")
+                    return {}
+                dump = json.loads(result.stdout)
+            except (subprocess.TimeoutExpired, FileNotFoundError, ValueError) as e:
+                self.logger.error(f"Error listing remotes: {e}")
+                return {}
+        elif "error" in dump:
+            self.logger.error(f"Error listing remotes: {dump['error']}")
+            return {}
+        
+        # Keep only the types; the dump also holds (obscured) credentials
+        remotes = {name: section.get("type") for name, section in dump.items()}
+        self._remotes_cache = (time.monotonic(), remotes)
+        return remotes
+    
+    def _fresh_remotes_cache(self) -> Optional[Tuple[float, Dict[str, Optional[str]]]]:
+        """Return the remotes cache entry if it has not expired yet."""
+        cached = self._remotes_cache
+        if cached is not None and time.monotonic() - cached[0] < self._remotes_ttl:
+            return cached
+        return None
+    
+    def invalidate_remotes_cache(self) -> None:
+        """Forget cached remotes after the rclone configuration changed."""
+        self._remotes_cache = None
+        self._tested_remotes.clear()
+        self._endpoints.clear()
+        
+        # The daemon keeps remotes open, drop them so new settings apply
+        if self._rcd_process and self._rcd_process.poll() is None:
+            self._rc_request("fscache/clear", {}, timeout=5)
+    
+    def remote_exists(self, remote_name: str) -> bool:
+        """Check if a remote exists.
+        
+        Uses the remotes cache when it is fresh, otherwise asks rclone
+        about this single remote.
+        
+        Args:
+            remote_name: Name of the remote
+            
+        Returns:
+            True if remote exists, False otherwise
+        """
+        cached = self._fresh_remotes_cache()
+        if cached is not None:
+            return remote_name in cached[1]
+        
+        reply = self._rc("config/get", {"name": remote_name}, timeout=5)
+        if reply is not None:
+            # Unknown remotes come back as an empty section
+            return bool(reply) and "error" not in reply
+        
         try:
             result = subprocess.run(
-                ["rclone", "listremotes"],
+                [self.binary, "config", "show", remote_name],
                 capture_output=True,
+                stdin=subprocess.DEVNULL,
                 text=True,
-                timeout=10
+                timeout=5
             )
-            if result.returncode == 0:
-                # Remove trailing colons and filter empty lines
-                remotes = [line.rstrip(':') for line in result.stdout.strip().split('\n') if line]
-                return remotes
-            else:
-                self.logger.error(f"Error listing remotes: {result.stderr}")
-                return []
+            return result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            self.logger.error(f"Error listing remotes: {e}")
-            return []
+            self.logger.error(f"Error checking remote: {e}")
+            return False
     
-    def remote_exists(self, remote_name: str) -> bool:
-        """Check if a remote exists.
+    def is_remote_verified(self, remote_name: str) -> bool:
+        """Check if a remote passed a connection test recently.
         
         Args:
             remote_name: Name of the remote
             
         Returns:
-            True if remote exists, False otherwise
+            True if a cached successful test has not expired yet
         """
-        remotes = self.list_remotes()
-        return remote_name in remotes
+        tested_at = self._tested_remotes.get(remote_name)
+        return tested_at is not None and time.monotonic() - tested_at < self._tested_ttl
     
-    def test_remote(self, remote_name: str) -> Tuple[bool, str]:
+    def test_remote(self, remote_name: str, force: bool = False) -> Tuple[bool, str]:
         """Test if a remote is accessible.
         
+        Successful results are cached for a few minutes per remote.
+        
         Args:
             remote_name: Name of the remote
+            force: If True, ignore a cached success and contact the remote
             
         Returns:
             Tuple of (success, message)
         """
+        if not force and self.is_remote_verified(remote_name):
+            return True, "Remote is accessible"
+        
+        reply = self._rc(
+            "operations/list",
+            {"fs": f"{remote_name}:", "remote": "", "opt": {"dirsOnly": True}},
+            timeout=30
+        )
+        if reply is not None:
+            if "error" in reply:
+                if reply["error"] == "Timeout":
+                    return False, "Timeout while testing remote"
+                return False, f"Error: {reply['error']}"
+            self._tested_remotes[remote_name] = time.monotonic()
+            return True, "Remote is accessible"
+        
         try:
             result = subprocess.run(
-                ["rclone", "lsd", f"{remote_name}:", "--max-depth", "1"],
+                [self.binary, "lsd", f"{remote_name}:", "--max-depth", "1"],
                 capture_output=True,
+                stdin=subprocess.DEVNULL,
                 text=True,
                 timeout=30
             )
             if result.returncode == 0:
+                self._tested_remotes[remote_name] = time.monotonic()
                 return True, "Remote is accessible"
             else:
                 return False, f"Error: {result.stderr.strip()}"
@@ -115,34 +495,47 @@ class RcloneManager:
         except Exception as e:
             return False, f"Error: {str(e)}"
     
-    def sync(
+    async def sync(
         self,
         source: str,
         destination: str,
-        progress_callback: Optional[Callable[[str], None]] = None,
+        progress_callback: Optional[Callable[[SyncProgress], None]] = None,
         dry_run: bool = False,
         filters: Optional[List[str]] = None,
-        bandwidth_limit_kbps: int = 0
+        bandwidth_limit_kbps: int = 0,
+        transfers: int = 16,
+        checkers: int = 8,
+        extra_args: Optional[List[str]] = None
     ) -> Tuple[bool, str]:
         """Perform sync operation.
         
+        Runs rclone as an asyncio subprocess on the caller's event loop.
+        
         Args:
             source: Source path (remote:path or local path)
             destination: Destination path (remote:path or local path)
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback receiving a SyncProgress
+                every second
             dry_run: If True, perform a dry run
             filters: Optional list of rclone filter arguments
             bandwidth_limit_kbps: Bandwidth limit in KB/s (0 = no limit)
+            transfers: Number of files transferred in parallel
+            checkers: Number of files checked in parallel
+            extra_args: Optional additional rclone flags
             
         Returns:
-            Tuple of (success, message)
+            Tuple of (success, message); rclone's exit code is left in
+            last_exit_code
         """
         cmd = [
-            "rclone", "sync",
+            self.binary, "sync",
             source,
             destination,
-            "--progress",
+            "--use-json-log",
             "--stats", "1s",
+            "--transfers", str(transfers),
+            "--checkers", str(checkers),
+            "--buffer-size", "16M",
             "-v"
         ]
         
@@ -155,42 +548,61 @@ class RcloneManager:
         if bandwidth_limit_kbps > 0:
             cmd.extend(["--bwlimit", f"{bandwidth_limit_kbps}k"])
         
+        if extra_args:
+            cmd.extend(extra_args)
+        
+        self.last_exit_code = None
         try:
             self.logger.info(f"Starting sync: {source} -> {destination}")
             
-            self.process = subprocess.Popen(
-                cmd,
+            # Own process group so cancel_sync can signal rclone and its children together
+            self._sync_loop = asyncio.get_running_loop()
+            self.process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                limit=_LINE_LIMIT,
+                **_NEW_GROUP_KWARGS
             )
             
-            output_lines = []
+            # Last log lines other than stats, decoded only if the sync fails
+            output_tail = deque(maxlen=500)
+            debug_enabled = self._debug_enabled
+            logger_debug = self.logger.debug
             
-            # Read output line by line
-            if self.process.stdout:
-                for line in iter(self.process.stdout.readline, ''):
-                    line = line.strip()
-                    if line:
-                        output_lines.append(line)
-                        self.logger.debug(line)
-                        if progress_callback:
-                            progress_callback(line)
+            # Read output line by line, only parsing the stats records
+            async for raw_line in self.process.stdout:
+                raw_line = raw_line.rstrip()
+                if not raw_line:
+                    continue
+                if _STATS_MARKER in raw_line:
+                    if progress_callback:
+                        try:
+                            stats = json.loads(raw_line).get("stats")
+                        except (ValueError, AttributeError):
+                            stats = None
+                        if isinstance(stats, dict):
+                            progress_callback(SyncProgress.from_stats(stats))
+                    continue
+                output_tail.append(raw_line)
+                if debug_enabled:
+                    logger_debug(self._log_line_message(raw_line))
             
             # Wait for process to complete
-            return_code = self.process.wait()
+            return_code = await self.process.wait()
             self.process = None
-            
-            full_output = '\n'.join(output_lines)
+            self.last_exit_code = return_code
             
             if return_code == 0:
                 self.logger.info("Sync completed successfully")
                 return True, "Sync completed successfully"
             else:
                 error_msg = f"Sync failed with return code {return_code}"
-                self.logger.error(error_msg)
+                tail = [self._log_line_message(line) for line in output_tail]
+                self.logger.error(f"{error_msg}; output tail:\n" + "\n".join(tail))
+                if tail:
+                    error_msg += f": {tail[-1]}"
                 return False, error_msg
                 
         except FileNotFoundError:
@@ -202,26 +614,66 @@ class RcloneManager:
             self.logger.error(error_msg)
             return False, error_msg
     
+    @staticmethod
+    def _log_line_message(raw_line: bytes) -> str:
+        """Extract the message from a JSON log line, or decode it as text."""
+        text = raw_line.decode("utf-8", errors="replace").strip()
+        try:
+            return json.loads(text)["msg"].strip()
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return text
+    
     def cancel_sync(self) -> bool:
         """Cancel ongoing sync operation.
         
+        Asks rclone to stop and kills it if it is still running two
+        seconds later. Safe to call from any thread.
+        
         Returns:
-            True if cancelled, False otherwise
+            True if cancellation was requested, False otherwise
         """
-        if self.process and self.process.poll() is None:
-            try:
-                self.process.terminate()
-                self.process.wait(timeout=5)
-                self.logger.info("Sync cancelled")
-                return True
-            except subprocess.TimeoutExpired:
-                self.process.kill()
-                self.logger.warning("Sync force killed")
-                return True
-            except Exception as e:
-                self.logger.error(f"Error cancelling sync: {e}")
-                return False
-        return False
+        process, loop = self.process, self._sync_loop
+        if process is None or process.returncode is not None or loop is None:
+            return False
+        
+        try:
+            loop.call_soon_threadsafe(self._terminate_sync, process)
+            return True
+        except RuntimeError as e:
+            self.logger.error(f"Error cancelling sync: {e}")
+            return False
+    
+    def _terminate_sync(self, process: asyncio.subprocess.Process) -> None:
+        """Signal rclone to stop; runs on the sync's event loop."""
+        if process.returncode is not None:
+            return
+        self._signal_process_group(process, force=False)
+        self.logger.info("Sync cancelled")
+        self._sync_loop.call_later(_KILL_GRACE, self._kill_sync, process)
+    
+    def _kill_sync(self, process: asyncio.subprocess.Process) -> None:
+        """Force kill rclone if it ignored the termination request."""
+        if process.returncode is None:
+            self._signal_process_group(process, force=True)
+            self.logger.warning("Sync force killed")
+    
+    @staticmethod
+    def _signal_process_group(process: asyncio.subprocess.Process, force: bool) -> None:
+        """Terminate or kill a sync process together with its children.
+        
+        On Windows rclone is asked to stop with CTRL_BREAK_EVENT, which
+        reaches its whole process group, and killed on its own if forced.
+        """
+        try:
+            if os.name == "nt":
+                if force:
+                    process.kill()
+                else:
+                    process.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # Already exited
     
     def is_syncing(self) -> bool:
         """Check if a sync operation is in progress.
@@ -229,7 +681,7 @@ class RcloneManager:
         Returns:
             True if syncing, False otherwise
         """
-        return self.process is not None and self.process.poll() is None
+        return self.process is not None and self.process.returncode is None
     
     def get_remote_type(self, remote_name: str) -> Optional[str]:
         """Get the type of a remote (e.g., 'protondrive', 's3', 'drive').
@@ -240,10 +692,19 @@ class RcloneManager:
         Returns:
             Remote type string or None if error
         """
+        cached = self._fresh_remotes_cache()
+        if cached is not None and remote_name in cached[1]:
+            return cached[1][remote_name]
+        
+        reply = self._rc("config/get", {"name": remote_name})
+        if reply is not None:
+            return reply.get("type")
+        
         try:
             result = subprocess.run(
-                ["rclone", "config", "show", remote_name],
+                [self.binary, "config", "show", remote_name],
                 capture_output=True,
+                stdin=subprocess.DEVNULL,
                 text=True,
                 timeout=10
             )
@@ -257,16 +718,49 @@ class RcloneManager:
             self.logger.error(f"Error getting remote type: {e}")
             return None
     
-    def has_protondrive_remote(self) -> Tuple[bool, Optional[str]]:
+    def get_remote_endpoint(self, remote_name: str) -> Optional[str]:
+        """Get the host a remote's backend connects to.
+        
+        Args:
+            remote_name: Name of the remote
+            
+        Returns:
+            Host name, or None if it is not known for the remote's type
+        """
+        if remote_name not in self._endpoints:
+            self._endpoints[remote_name] = _BACKEND_HOSTS.get(self.get_remote_type(remote_name) or "")
+        return self._endpoints[remote_name]
+    
+    def list_remotes_typed(self, force_refresh: bool = False) -> List[Tuple[str, Optional[str]]]:
+        """List all configured rclone remotes along with their types.
+        
+        Args:
+            force_refresh: If True, bypass the remotes cache
+        
+        Returns:
+            List of (remote_name, remote_type) tuples
+        """
+        return list(self._remote_types(force_refresh).items())
+    
+    def has_protondrive_remote(
+        self,
+        remotes: Optional[List[Tuple[str, Optional[str]]]] = None,
+        force_refresh: bool = False
+    ) -> Tuple[bool, Optional[str]]:
         """Check if any ProtonDrive remote is configured.
         
+        Args:
+            remotes: Optional (name, type) list from list_remotes_typed();
+                queried from rclone when omitted
+            force_refresh: If True, bypass the remotes cache when querying
+        
         Returns:
             Tuple of (has_protondrive, remote_name)
         """
-        remotes = self.list_remotes()
-        for remote in remotes:
-            remote_type = self.get_remote_type(remote)
-            if remote_type and 'proton' in remote_type.lower():
+        if remotes is None:
+            remotes = self.list_remotes_typed(force_refresh=force_refresh)
+        for remote, remote_type in remotes:
+            if remote_type == "protondrive":
                 return True, remote
         return False, None
     
@@ -280,11 +774,30 @@ class RcloneManager:
         Returns:
             List of dictionaries with folder info (name, path, size, modtime)
         """
+        reply = self._rc(
+            "operations/list",
+            {"fs": f"{remote_name}:", "remote": path, "opt": {"dirsOnly": True, "noModTime": True}},
+            timeout=30
+        )
+        if reply is not None:
+            if "error" in reply:
+                self.logger.error(f"Error listing folders: {reply['error']}")
+                return []
+            return [
+                {
+                    "name": item["Name"],
+                    "path": item["Path"],
+                    "full_path": f"{remote_name}:{item['Path']}"
+                }
+                for item in reply.get("list") or []
+            ]
+        
         try:
             remote_path = f"{remote_name}:{path}"
             result = subprocess.run(
-                ["rclone", "lsf", remote_path, "--dirs-only", "--format", "p"],
+                [self.binary, "lsf", remote_path, "--dirs-only", "--format", "p"],
                 capture_output=True,
+                stdin=subprocess.DEVNULL,
                 text=True,
                 timeout=30
             )
@@ -339,55 +852,6 @@ class RcloneManager:
         
         return build_tree()
     
-    def estimate_sync_size(
-        self,
-        source: str,
-        destination: str,
-        filters: Optional[List[str]] = None
-    ) -> Tuple[bool, Dict[str, any]]:
-        """Estimate the size of data that would be synced.
-        
-        Args:
-            source: Source path
-            destination: Destination path
-            filters: Optional list of rclone filter arguments
-            
-        Returns:
-            Tuple of (success, stats_dict)
-        """
-        cmd = [
-            "rclone", "size",
-            source,
-            "--json"
-        ]
-        
-        if filters:
-            cmd.extend(filters)
-        
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                import json
-                stats = json.loads(result.stdout)
-                return True, {
-                    "bytes": stats.get("bytes", 0),
-                    "count": stats.get("count", 0),
-                    "size_mb": stats.get("bytes", 0) / (1024 * 1024),
-                    "size_gb": stats.get("bytes", 0) / (1024 * 1024 * 1024)
-                }
-            else:
-                self.logger.error(f"Error estimating size: {result.stderr}")
-                return False, {}
-        except Exception as e:
-            self.logger.error(f"Error estimating size: {e}")
-            return False, {}
-    
     def configure_protondrive(self) -> Tuple[bool, str]:
         """Launch interactive ProtonDrive configuration.
         
@@ -395,10 +859,7 @@ class RcloneManager:
             Tuple of (success, message)
         """
         try:
-            # Launch rclone config in a terminal
-            import os
-            
-            # Try different terminal emulators
+            # Launch rclone config in a terminal, trying different emulators
             terminals = [
                 ['x-terminal-emulator', '-e'],
                 ['gnome-terminal', '--'],
@@ -411,7 +872,7 @@ class RcloneManager:
             
             for term in terminals:
                 try:
-                    subprocess.Popen(term + ['rclone', 'config'])
+                    subprocess.Popen(term + [self.binary, 'config'])
                     return True, "rclone config launched in terminal"
                 except FileNotFoundError:
                     continue
@@ -1,14 +1,77 @@
-"""Background sync engine with threading."""
+"""Background sync engine running on an asyncio event loop."""
 
+import asyncio
+import concurrent.futures
+import gzip
+import json
+import os
 import threading
 import time
+import urllib.request
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List, Tuple
 import logging
 
-from .rclone_manager import RcloneManager
+from .rclone_manager import RcloneManager, SyncProgress, EXIT_MAX_TRANSFER
 from .config_manager import ConfigManager
+from .utils import SyncLock, flush_logging, host_reachable
+
+
+# Share of files that may differ from the saved listing before the
+# first-sync safety checks run again
+_LISTING_CHANGE_LIMIT = 0.01
+
+# Seconds a sync stopped at a safety limit waits for respond_to_warning
+_CONFIRM_TIMEOUT = 60
+
+# Event loop shared by every SyncEngine, started on first use
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_loop_lock = threading.Lock()
+
+
+def _get_shared_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop, starting its thread if needed.
+    
+    Returns:
+        Event loop running forever in a daemon thread
+    """
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="sync-loop", daemon=True).start()
+            _shared_loop = loop
+        return _shared_loop
+
+
+def _scan_tree(root: str) -> Dict[str, List[int]]:
+    """Map every file below root to its [size, mtime_ns].
+    
+    Args:
+        root: Directory to scan
+        
+    Returns:
+        Dictionary keyed by path relative to root
+    """
+    root = os.path.abspath(root)
+    prefix_len = len(root.rstrip(os.sep)) + 1
+    entries: Dict[str, List[int]] = {}
+    stack = [root]
+    
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        entries[entry.path[prefix_len:]] = [st.st_size, st.st_mtime_ns]
+        except OSError:
+            continue
+    
+    return entries
 
 
 class SyncEngine:
@@ -32,20 +95,64 @@ class SyncEngine:
         self.logger = logger or logging.getLogger(__name__)
         
         self.is_running = False
-        self.sync_thread: Optional[threading.Thread] = None
-        self.auto_sync_thread: Optional[threading.Thread] = None
-        self.stop_event = threading.Event()
+        self._stop_event: Optional[asyncio.Event] = None
+        self._auto_sync_future = None
+        
+        # One event loop thread, shared with any other engine, runs the
+        # auto-sync timer, every sync and rclone's output pipe
+        self._loop = _get_shared_loop()
         
-        self.last_sync_time: Optional[datetime] = None
+        # Epoch seconds of the last successful sync (0.0 = never) and
+        # its ISO string, formatted once per sync rather than per poll
+        self._last_sync_epoch = 0.0
+        self._last_sync_iso: Optional[str] = None
         self.sync_in_progress = False
         self.sync_paused = False
         self.first_sync_done = False
+        # (remote, local folder) that first_sync_done applies to
+        self._first_sync_target: Optional[Tuple[str, str]] = None
+        
+        # Sync filters as of config version _filters_version
+        self._cached_filters: List[str] = []
+        self._filters_version = -1
+        
+        # Consecutive syncs skipped because the remote was unreachable
+        self._offline_streak = 0
+        
+        # Answer to the pending on_sync_warning, set by respond_to_warning
+        self._warning_future: Optional[asyncio.Future] = None
+        self._last_warning_type: Optional[str] = None
+        
+        # Set when a safety warning was declined; scheduled syncs wait
+        # until the user starts one
+        self._scheduled_syncs_held = False
+        
+        # The running sync, manual or scheduled, and the future of a
+        # manual sync whose task has not started yet
+        self._sync_task: Optional[asyncio.Task] = None
+        self._sync_future: Optional[concurrent.futures.Future] = None
+        
+        # Latest progress of the running sync, and the latest not yet
+        # passed to on_sync_progress
+        self._latest_progress: Optional[SyncProgress] = None
+        self._pending_progress: Optional[SyncProgress] = None
+        self._progress_flush_scheduled = False
+        
+        # Shared with other app instances so only one of them syncs at a time
+        self._sync_lock = SyncLock(self.config.config_dir / "sync.lock")
+        
+        # Local files as of the last successful sync
+        self._listing_cache_path = self.config.config_dir / "listing.json.gz"
+        
+        # Last sync time and first-sync flag, kept across restarts
+        self._state_path = self.config.config_dir / "sync_state.json"
+        self._load_state()
         
         # Callbacks
         self.on_sync_start: Optional[Callable] = None
         self.on_sync_complete: Optional[Callable[[bool, str]]] = None
-        self.on_sync_progress: Optional[Callable[[str]]] = None
-        self.on_sync_warning: Optional[Callable[[str, dict]]] = None  # For warnings before large syncs
+        self.on_sync_progress: Optional[Callable[[SyncProgress]]] = None
+        self.on_sync_warning: Optional[Callable[[str, dict]]] = None  # Answer with respond_to_warning
     
     def start_auto_sync(self) -> bool:
         """Start automatic sync in background.
@@ -62,13 +169,9 @@ class SyncEngine:
             return False
         
         self.is_running = True
-        self.stop_event.clear()
-        
-        self.auto_sync_thread = threading.Thread(
-            target=self._auto_sync_loop,
-            daemon=True
+        self._auto_sync_future = asyncio.run_coroutine_threadsafe(
+            self._auto_sync_loop(), self._loop
         )
-        self.auto_sync_thread.start()
         
         self.logger.info("Auto sync started")
         return True
@@ -79,135 +182,261 @@ class SyncEngine:
             return
         
         self.is_running = False
-        self.stop_event.set()
-        
-        if self.auto_sync_thread and self.auto_sync_thread.is_alive():
-            self.auto_sync_thread.join(timeout=5)
+        stop_event = self._stop_event
+        if stop_event is not None:
+            self._loop.call_soon_threadsafe(stop_event.set)
         
         self.logger.info("Auto sync stopped")
     
-    def _auto_sync_loop(self) -> None:
-        """Main loop for automatic sync."""
-        interval = self.config.get("sync_interval_minutes", 30) * 60
+    async def _auto_sync_loop(self) -> None:
+        """Main loop for automatic sync.
+        
+        Syncs start on a fixed schedule measured from when auto sync was
+        started, so the time a sync takes does not push back the next one.
+        """
+        # Created here so it belongs to the sync loop
+        stop_event = asyncio.Event()
+        self._stop_event = stop_event
         
-        while self.is_running and not self.stop_event.is_set():
-            # Perform sync
-            self.sync_now()
+        deadline = time.monotonic()
+        while self.is_running and not stop_event.is_set():
+            # Perform sync unless a manual one is already running or the
+            # user declined to continue past a safety limit
+            if self._scheduled_syncs_held:
+                self.logger.info("Scheduled sync skipped until a sync is started manually")
+            elif not self.sync_in_progress:
+                self.sync_in_progress = True
+                # Waited on without awaiting it directly, so cancelling the
+                # sync does not end the auto-sync loop
+                await asyncio.wait({self._start_sync_task(False)})
             
-            # Wait for next interval or stop event
-            self.stop_event.wait(timeout=interval)
+            # Re-read so interval changes apply without a restart, back off
+            # up to 8x while offline, and skip any slots a long sync ran past
+            interval = max(1, self.config.get("sync_interval_minutes", 30)) * 60
+            interval *= 2 ** min(self._offline_streak, 3)
+            now = time.monotonic()
+            deadline += interval
+            if deadline <= now:
+                deadline += ((now - deadline) // interval + 1) * interval
+            
+            # Wait for next scheduled sync or stop event
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=deadline - now)
+            except asyncio.TimeoutError:
+                pass
     
-    def sync_now(self, blocking: bool = False) -> bool:
+    def sync_now(self, blocking: bool = False, force: bool = False,
+                 waive: Tuple[str, ...] = ()) -> Optional[concurrent.futures.Future]:
         """Trigger an immediate sync.
         
         Args:
             blocking: If True, wait for sync to complete
+            force: If True, skip the first-sync safety limits
+            waive: Safety warning types ("large_sync", "max_delete") the
+                user already confirmed; only those limits are dropped
             
         Returns:
-            True if sync started, False otherwise
+            Future that completes when the sync ends, or None if the sync
+            could not be started
         """
         if self.sync_in_progress:
             self.logger.warning("Sync already in progress")
-            return False
+            return None
         
         if not self.config.is_configured():
             self.logger.error("Cannot sync: not configured")
-            return False
+            return None
         
+        # Claim the sync now so a second request cannot slip in before
+        # the coroutine starts
+        self.sync_in_progress = True
+        self._scheduled_syncs_held = False
+        future = asyncio.run_coroutine_threadsafe(self._run_sync(force, frozenset(waive)), self._loop)
+        self._sync_future = future
+        future.add_done_callback(self._clear_sync_future)
         if blocking:
-            self._perform_sync()
-            return True
-        else:
-            self.sync_thread = threading.Thread(
-                target=self._perform_sync,
-                daemon=True
-            )
-            self.sync_thread.start()
-            return True
+            try:
+                future.result()
+            except concurrent.futures.CancelledError:
+                pass
+        return future
     
-    def _perform_sync(self, force_sync: bool = False) -> None:
+    def _clear_sync_future(self, future: concurrent.futures.Future) -> None:
+        """Forget a finished sync_now future."""
+        if self._sync_future is future:
+            self._sync_future = None
+    
+    def _start_sync_task(self, force_sync: bool,
+                         waived: frozenset = frozenset()) -> asyncio.Task:
+        """Start a sync as the task cancel_sync stops; runs on the sync loop.
+        
+        Args:
+            force_sync: If True, skip safety checks
+            waived: Safety warning types whose limits are dropped
+            
+        Returns:
+            The sync task
+        """
+        task = self._loop.create_task(self._perform_sync(force_sync, waived))
+        self._sync_task = task
+        task.add_done_callback(self._clear_sync_task)
+        return task
+    
+    def _clear_sync_task(self, task: asyncio.Task) -> None:
+        """Forget a finished sync task."""
+        if self._sync_task is task:
+            self._sync_task = None
+    
+    async def _run_sync(self, force_sync: bool, waived: frozenset) -> None:
+        """Run a sync requested by sync_now.
+        
+        Args:
+            force_sync: If True, skip safety checks
+            waived: Safety warning types whose limits are dropped
+        """
+        await self._start_sync_task(force_sync, waived)
+    
+    async def _perform_sync(self, force_sync: bool = False,
+                            waived: frozenset = frozenset()) -> None:
         """Perform the actual sync operation.
         
         Args:
             force_sync: If True, skip safety checks
+            waived: Safety warning types whose limits are dropped
         """
         self.sync_in_progress = True
         
+        # Don't start rclone just to have it retry while offline
+        remote = self.config.get("rclone_remote")
+        try:
+            reachable = await self._loop.run_in_executor(None, self._remote_reachable, remote)
+        except asyncio.CancelledError:
+            self.sync_in_progress = False
+            self.logger.info("Sync cancelled")
+            if self.on_sync_complete:
+                self.on_sync_complete(False, "Sync cancelled")
+            raise
+        if not reachable:
+            self._offline_streak += 1
+            self.logger.info("Network unreachable, skipping this sync")
+            self.sync_in_progress = False
+            if self.on_sync_complete:
+                self.on_sync_complete(False, "Network unreachable, sync skipped")
+            return
+        self._offline_streak = 0
+        
+        # Another instance of the app may be syncing the same folder
+        if self.config.get("lock_mode", "exit") == "wait":
+            pending = self._loop.run_in_executor(None, self._sync_lock.acquire, True)
+            try:
+                acquired = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The blocked acquire cannot be interrupted, so let go of
+                # the lock as soon as it is taken
+                pending.add_done_callback(lambda _: self._sync_lock.release())
+                self.sync_in_progress = False
+                self.logger.info("Sync cancelled while waiting for another instance")
+                if self.on_sync_complete:
+                    self.on_sync_complete(False, "Sync cancelled")
+                raise
+        else:
+            acquired = self._sync_lock.acquire()
+        if not acquired:
+            self.logger.warning("Another ProtonDrive Sync instance is syncing, skipping this sync")
+            self.sync_in_progress = False
+            if self.on_sync_complete:
+                self.on_sync_complete(False, "Another ProtonDrive Sync instance is already syncing")
+            return
+        
+        self._latest_progress = None
         if self.on_sync_start:
             self.on_sync_start()
         
         try:
-            remote = self.config.get("rclone_remote")
             local_folder = self.config.get("local_folder")
             
             # Construct paths
             source = f"{remote}:"
             destination = local_folder
             
-            # Get sync filters
-            filters = self.config.get_sync_filters()
+            # A different remote or folder needs the first-sync checks again
+            if self._first_sync_target != (remote, local_folder):
+                self.first_sync_done = False
+            
+            # Get sync filters, rebuilt only when the config has changed
+            if self.config.version != self._filters_version:
+                self._cached_filters = self.config.get_sync_filters()
+                self._filters_version = self.config.version
+            filters = self._cached_filters
             
-            # Get bandwidth limit
+            # Get bandwidth limit and parallelism
             bandwidth_limit = self.config.get("bandwidth_limit_kbps", 0)
+            transfers = self.config.get("rclone_transfers", 16)
+            checkers = self.config.get("rclone_checkers", max(8, (os.cpu_count() or 4) * 2))
             
-            # Safety check for first sync
+            # The first-sync checks are not needed if the local folder still
+            # matches what the last successful sync of this remote left behind
             if not self.first_sync_done and not force_sync:
-                if self.config.get("dry_run_first_sync", True):
-                    self.logger.info("Performing dry-run for first sync...")
-                    dry_success, dry_msg = self.rclone.sync(
-                        source=source,
-                        destination=destination,
-                        progress_callback=self._handle_progress,
-                        dry_run=True,
-                        filters=filters
-                    )
-                    
-                    if not dry_success:
-                        self.logger.error(f"Dry-run failed: {dry_msg}")
-                        if self.on_sync_complete:
-                            self.on_sync_complete(False, f"Dry-run failed: {dry_msg}")
-                        self.sync_in_progress = False
-                        return
-                
-                # Estimate sync size
-                success, size_info = self.rclone.estimate_sync_size(
-                    source=source,
-                    destination=destination,
-                    filters=filters
-                )
-                
-                if success:
-                    size_mb = size_info.get("size_mb", 0)
-                    threshold = self.config.get("large_sync_threshold_mb", 1000)
-                    
-                    if size_mb > threshold and self.config.get("confirm_large_sync", True):
-                        # Warn about large sync
-                        if self.on_sync_warning:
-                            self.on_sync_warning("large_sync", size_info)
-                        
-                        # If no confirmation callback or user didn't confirm, abort
-                        # (The GUI will handle this callback and show a dialog)
-                        self.logger.warning(f"Large sync detected: {size_mb:.2f} MB")
-                        # For now, we'll proceed - the GUI will handle confirmation
+                if await self._loop.run_in_executor(
+                    None, self._local_tree_unchanged, remote, destination, filters
+                ):
+                    self.logger.info("Local folder unchanged since last sync, skipping first-sync checks")
+                    self.first_sync_done = True
+                    self._first_sync_target = (remote, destination)
+            
+            # On the first sync rclone checks everything before transferring
+            # and stops instead of deleting or downloading too much
+            threshold = self.config.get("large_sync_threshold_mb", 1000)
+            first_sync = not self.first_sync_done and not force_sync
+            safety_args = self._safety_args(threshold, waived) if first_sync else []
             
             self.logger.info(f"Syncing {source} to {destination}")
             if filters:
                 self.logger.info(f"Using filters: {filters}")
             
-            # Perform sync
-            success, message = self.rclone.sync(
-                source=source,
-                destination=destination,
-                progress_callback=self._handle_progress,
-                dry_run=False,
-                filters=filters,
-                bandwidth_limit_kbps=bandwidth_limit
-            )
+            # Perform sync, continuing without a safety limit if the user
+            # confirms after rclone stopped at it
+            while True:
+                success, message = await self.rclone.sync(
+                    source=source,
+                    destination=destination,
+                    progress_callback=self._handle_progress,
+                    dry_run=False,
+                    filters=filters,
+                    bandwidth_limit_kbps=bandwidth_limit,
+                    transfers=transfers,
+                    checkers=checkers,
+                    extra_args=safety_args
+                )
+                self._flush_progress()
+                
+                if success or not safety_args:
+                    break
+                warning = self._safety_stop_warning(message, threshold)
+                if warning is None or warning[0] in waived:
+                    break
+                
+                self.logger.warning(f"First sync stopped by safety limit: {message}")
+                if not await self._confirm_warning(*warning):
+                    # Otherwise every scheduled sync would transfer up to
+                    # the limit again before asking
+                    self._scheduled_syncs_held = True
+                    message = "Sync stopped at safety limit; scheduled syncs paused until you sync manually"
+                    break
+                self.logger.info(f"Continuing sync without the {warning[0]} limit")
+                waived = waived | {warning[0]}
+                safety_args = self._safety_args(threshold, waived)
             
             if success:
-                self.last_sync_time = datetime.now()
+                self._last_sync_epoch = time.time()
+                self._last_sync_iso = None
                 self.first_sync_done = True
+                self._first_sync_target = (remote, destination)
                 self.logger.info("Sync completed successfully")
+                await self._loop.run_in_executor(None, self._save_state, remote, destination)
+                await self._loop.run_in_executor(
+                    None, self._save_local_listing, remote, destination, filters
+                )
             else:
                 self.logger.error(f"Sync failed: {message}")
             
@@ -215,21 +444,231 @@ class SyncEngine:
             if self.on_sync_complete:
                 self.on_sync_complete(success, message)
                 
+        except asyncio.CancelledError:
+            self.logger.info("Sync cancelled")
+            if self.on_sync_complete:
+                self.on_sync_complete(False, "Sync cancelled")
+            raise
         except Exception as e:
             self.logger.error(f"Error during sync: {e}")
             if self.on_sync_complete:
                 self.on_sync_complete(False, str(e))
         finally:
+            self._sync_lock.release()
             self.sync_in_progress = False
+            flush_logging(self.logger)
     
-    def _handle_progress(self, line: str) -> None:
+    def _remote_reachable(self, remote: str) -> bool:
+        """Probe the remote's API host with a single TCP connection.
+        
+        Args:
+            remote: Name of the rclone remote
+            
+        Returns:
+            False if the host is known and cannot be reached, True otherwise
+        """
+        # rclone may only reach the internet through the proxy
+        if "https" in urllib.request.getproxies():
+            return True
+        host = self.rclone.get_remote_endpoint(remote)
+        return host is None or host_reachable(host)
+    
+    async def _confirm_warning(self, warning_type: str, data: dict) -> bool:
+        """Report a warning and wait for the answer from respond_to_warning.
+        
+        Args:
+            warning_type: Warning type passed to on_sync_warning
+            data: Warning details passed to on_sync_warning
+            
+        Returns:
+            True to proceed, False if declined, unanswered or nobody listens
+        """
+        if not self.on_sync_warning:
+            return False
+        
+        future = self._loop.create_future()
+        self._warning_future = future
+        self._last_warning_type = warning_type
+        try:
+            self.on_sync_warning(warning_type, data)
+            return await asyncio.wait_for(future, timeout=_CONFIRM_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger.warning("No answer to sync warning, not continuing")
+            return False
+        finally:
+            self._warning_future = None
+    
+    def respond_to_warning(self, proceed: bool) -> None:
+        """Answer the last on_sync_warning. Safe to call from any thread.
+        
+        If the sync stopped waiting for an answer, proceeding starts a
+        new sync without the limit that warning was about.
+        
+        Args:
+            proceed: True to continue the sync, False to stop it
+        """
+        self._loop.call_soon_threadsafe(self._resolve_warning, proceed)
+    
+    def _resolve_warning(self, proceed: bool) -> None:
+        """Deliver a warning answer; runs on the sync event loop."""
+        future = self._warning_future
+        if future is not None and not future.done():
+            future.set_result(proceed)
+        elif proceed and self._last_warning_type:
+            self.sync_now(waive=(self._last_warning_type,))
+    
+    def _safety_args(self, threshold_mb: int, waived: frozenset) -> List[str]:
+        """Build the rclone limits for a first sync.
+        
+        Args:
+            threshold_mb: Transfer size that needs confirmation, in MB
+            waived: Safety warning types whose limits are dropped
+            
+        Returns:
+            Extra rclone arguments
+        """
+        args = ["--check-first"]
+        if "max_delete" not in waived:
+            args += ["--max-delete", str(self.config.get("max_delete", 1000))]
+        if "large_sync" not in waived and self.config.get("confirm_large_sync", True):
+            args += ["--max-transfer", f"{threshold_mb}M", "--cutoff-mode", "soft"]
+        return args
+    
+    def _safety_stop_warning(self, message: str, threshold_mb: int) -> Optional[tuple]:
+        """Work out whether a failed first sync hit one of its safety limits.
+        
+        Args:
+            message: Failure message returned by the sync
+            threshold_mb: Large sync threshold passed as --max-transfer
+            
+        Returns:
+            (warning_type, data) for on_sync_warning, or None if the sync
+            failed for another reason
+        """
+        if "max-delete" in message:
+            return "max_delete", {"max_delete": self.config.get("max_delete", 1000)}
+        if self.rclone.last_exit_code == EXIT_MAX_TRANSFER:
+            return "large_sync", {
+                "size_mb": threshold_mb,
+                "size_gb": threshold_mb / 1024
+            }
+        return None
+    
+    def _local_tree_unchanged(self, remote: str, root: str, filters: List[str]) -> bool:
+        """Compare the local folder with the listing saved after the last sync.
+        
+        Args:
+            remote: Remote being synced
+            root: Local sync folder
+            filters: rclone filter arguments of this sync
+            
+        Returns:
+            True if the listing was saved for the same remote, folder and
+            filters and at most a small share of files changed
+        """
+        try:
+            with gzip.open(self._listing_cache_path, "rt", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        old = saved.get("entries") or {}
+        if (saved.get("remote") != remote or saved.get("root") != os.path.abspath(root) or
+                saved.get("filters") != list(filters) or not old):
+            return False
+        
+        new = _scan_tree(root)
+        changed = len(old.keys() ^ new.keys())
+        changed += sum(1 for path in old.keys() & new.keys() if old[path] != new[path])
+        return changed <= len(old) * _LISTING_CHANGE_LIMIT
+    
+    def _load_state(self) -> None:
+        """Restore the last sync time and first-sync flag saved by _save_state.
+        
+        The state is only used if it was saved for the remote and local
+        folder that are configured now.
+        """
+        try:
+            with open(self._state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if not isinstance(state, dict):
+            return
+        if (state.get("remote") != self.config.get("rclone_remote") or
+                state.get("local_folder") != self.config.get("local_folder")):
+            return
+        
+        self._last_sync_epoch = float(state.get("last_sync_time") or 0.0)
+        self.first_sync_done = bool(state.get("first_sync_done", False))
+        self._first_sync_target = (state["remote"], state["local_folder"])
+    
+    def _save_state(self, remote: str, local_folder: str) -> None:
+        """Save the last sync time and first-sync flag atomically.
+        
+        Args:
+            remote: Remote that was synced
+            local_folder: Local folder that was synced
+        """
+        state = {
+            "remote": remote,
+            "local_folder": local_folder,
+            "last_sync_time": self._last_sync_epoch,
+            "first_sync_done": self.first_sync_done
+        }
+        tmp_path = self._state_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._state_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save sync state: {e}")
+    
+    def _save_local_listing(self, remote: str, root: str, filters: List[str]) -> None:
+        """Save the local folder listing, replacing the old one atomically.
+        
+        Args:
+            remote: Remote that was synced
+            root: Local sync folder
+            filters: rclone filter arguments of the sync
+        """
+        tmp_path = self._listing_cache_path.with_suffix(".tmp")
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump({
+                    "remote": remote,
+                    "root": os.path.abspath(root),
+                    "filters": list(filters),
+                    "entries": _scan_tree(root)
+                }, f)
+            os.replace(tmp_path, self._listing_cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save local listing: {e}")
+    
+    def _handle_progress(self, progress: SyncProgress) -> None:
         """Handle progress updates from rclone.
         
+        Updates are coalesced so listeners get at most ten per second,
+        always with the latest statistics.
+        
         Args:
-            line: Progress line from rclone
+            progress: Transfer statistics reported by rclone
         """
-        if self.on_sync_progress:
-            self.on_sync_progress(line)
+        self._latest_progress = progress
+        self._pending_progress = progress
+        if not self._progress_flush_scheduled:
+            self._progress_flush_scheduled = True
+            self._loop.call_later(0.1, self._flush_progress)
+    
+    def _flush_progress(self) -> None:
+        """Pass the latest pending progress update to the listener."""
+        self._progress_flush_scheduled = False
+        progress, self._pending_progress = self._pending_progress, None
+        if progress is not None and self.on_sync_progress:
+            self.on_sync_progress(progress)
     
     def cancel_sync(self) -> bool:
         """Cancel ongoing sync.
@@ -240,7 +679,24 @@ class SyncEngine:
         if not self.sync_in_progress:
             return False
         
-        return self.rclone.cancel_sync()
+        if self.rclone.cancel_sync():
+            return True
+        
+        # Stopped at a safety limit and waiting for confirmation
+        if self._warning_future is not None:
+            self.respond_to_warning(False)
+            return True
+        
+        # rclone is not running, e.g. while waiting for the lock or
+        # checking whether the remote is reachable, so stop the sync itself
+        task = self._sync_task
+        if task is not None and not task.done():
+            self._loop.call_soon_threadsafe(task.cancel)
+            return True
+        
+        # A manual sync whose task has not started yet
+        future = self._sync_future
+        return future is not None and future.cancel()
     
     def pause_sync(self) -> bool:
         """Pause ongoing sync.
@@ -268,17 +724,36 @@ class SyncEngine:
             return True
         return False
     
+    @property
+    def last_sync_time(self) -> Optional[datetime]:
+        """Time of the last successful sync, or None if never synced."""
+        if not self._last_sync_epoch:
+            return None
+        return datetime.fromtimestamp(self._last_sync_epoch)
+    
+    def _format_last_sync(self) -> Optional[str]:
+        """Get the last sync time as an ISO string, formatting it lazily.
+        
+        Returns:
+            ISO formatted time, or None if never synced
+        """
+        if self._last_sync_iso is None and self._last_sync_epoch:
+            self._last_sync_iso = datetime.fromtimestamp(self._last_sync_epoch).isoformat()
+        return self._last_sync_iso
+    
     def get_status(self) -> dict:
         """Get current sync status.
         
         Returns:
-            Dictionary with status information
+            Dictionary with status information; "progress" is the latest
+            SyncProgress of the current or last sync, or None
         """
         return {
             "is_running": self.is_running,
             "sync_in_progress": self.sync_in_progress,
             "sync_paused": self.sync_paused,
-            "last_sync_time": self.last_sync_time.isoformat() if self.last_sync_time else None,
+            "last_sync_time": self._format_last_sync(),
             "configured": self.config.is_configured(),
-            "first_sync_done": self.first_sync_done
+            "first_sync_done": self.first_sync_done,
+            "progress": self._latest_progress
         }
@@ -1,11 +1,26 @@
 """Utility functions for ProtonDrive Sync."""
 
+import functools
 import logging
 import os
-from datetime import datetime
+import socket
+from logging.handlers import MemoryHandler, RotatingFileHandler
+import time
 from pathlib import Path
 from typing import Optional
 
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+# Units used by format_bytes, in steps of 1024
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Last (epoch second, formatted string) returned by get_timestamp
+_timestamp_cache = (-1, "")
+
 
 def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> logging.Logger:
     """Setup logging configuration.
@@ -33,17 +48,29 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> l
     console_handler.setFormatter(console_format)
     logger.addHandler(console_handler)
     
-    # File handler (if specified)
+    # File handler (if specified), rotated and buffered so progress
+    # logging does not write to disk line by line
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=3)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(console_format)
-        logger.addHandler(file_handler)
+        buffered_handler = MemoryHandler(capacity=512, flushLevel=logging.ERROR, target=file_handler)
+        logger.addHandler(buffered_handler)
     
     return logger
 
 
+def flush_logging(logger: logging.Logger) -> None:
+    """Write out any log records buffered by the logger's handlers.
+    
+    Args:
+        logger: Logger whose handlers should be flushed
+    """
+    for handler in logger.handlers:
+        handler.flush()
+
+
 def format_bytes(bytes_value: int) -> str:
     """Format bytes to human-readable format.
     
@@ -53,11 +80,13 @@ def format_bytes(bytes_value: int) -> str:
     Returns:
         Formatted string (e.g., '1.5 MB')
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.2f} PB"
+    # Also covers fractions and negative values
+    if bytes_value < 1024:
+        return f"{bytes_value:.2f} B"
+    # Each unit is 2**10 times the previous one; truncating never changes
+    # which power of 1024 a value has reached
+    index = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (index * 10)):.2f} {_BYTE_UNITS[index]}"
 
 
 def format_duration(seconds: float) -> str:
@@ -69,16 +98,14 @@ def format_duration(seconds: float) -> str:
     Returns:
         Formatted string (e.g., '2m 30s')
     """
-    if seconds < 60:
-        return f"{int(seconds)}s"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        secs = int(seconds % 60)
-        return f"{minutes}m {secs}s"
-    else:
-        hours = int(seconds / 3600)
-        minutes = int((seconds % 3600) / 60)
+    total = int(seconds)
+    if total < 60:
+        return f"{total}s"
+    hours, rest = divmod(total, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
         return f"{hours}h {minutes}m"
+    return f"{minutes}m {secs}s"
 
 
 def get_timestamp() -> str:
@@ -87,7 +114,11 @@ def get_timestamp() -> str:
     Returns:
         Formatted timestamp string
     """
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+    return _timestamp_cache[1]
 
 
 def validate_path(path: str) -> bool:
@@ -99,13 +130,38 @@ def validate_path(path: str) -> bool:
     Returns:
         True if valid and accessible, False otherwise
     """
+    # Results are reused for up to a second
+    return _path_accessible(str(path), int(time.monotonic()))
+
+
+@functools.lru_cache(maxsize=256)
+def _path_accessible(path: str, _tick: int) -> bool:
+    """Check read/write access with one syscall; _tick expires cached results."""
     try:
-        p = Path(path)
-        return p.exists() and os.access(p, os.R_OK | os.W_OK)
+        # access() fails for missing paths, so no separate exists() is needed
+        return os.access(path, os.R_OK | os.W_OK)
     except (OSError, ValueError):
         return False
 
 
+def host_reachable(host: str, port: int = 443, timeout: float = 1.5) -> bool:
+    """Check whether a TCP connection to a host can be opened.
+    
+    Args:
+        host: Host name
+        port: TCP port
+        timeout: Seconds to wait for the connection
+        
+    Returns:
+        True if the connection succeeded, False otherwise
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
 def ensure_directory(path: Path) -> bool:
     """Ensure a directory exists, create if it doesn't.
     
@@ -115,9 +171,70 @@ def ensure_directory(path: Path) -> bool:
     Returns:
         True if directory exists/created successfully, False otherwise
     """
+    # Skip the mkdir calls in the common case of an existing directory
+    if os.path.isdir(path):
+        return True
     try:
         path.mkdir(parents=True, exist_ok=True)
         return True
     except (OSError, PermissionError) as e:
         print(f"Error creating directory {path}: {e}")
         return False
+
+
+class SyncLock:
+    """Advisory lock file that lets only one process sync at a time."""
+    
+    def __init__(self, path: Path):
+        """Initialize the lock.
+        
+        Args:
+            path: Lock file path, created if missing
+        """
+        self.path = path
+        self._fd: Optional[int] = None
+    
+    def acquire(self, blocking: bool = False) -> bool:
+        """Take the lock.
+        
+        Args:
+            blocking: If True, wait until the lock is free
+            
+        Returns:
+            True if the lock is now held, False if another process holds it
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.name == "nt":
+                # LK_LOCK gives up after ~10 seconds, so keep retrying
+                mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+                while True:
+                    try:
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        msvcrt.locking(fd, mode, 1)
+                        break
+                    except OSError:
+                        if not blocking:
+                            raise
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        
+        self._fd = fd
+        return True
+    
+    def release(self) -> None:
+        """Release the lock if it is held."""
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        try:
+            if os.name == "nt":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)